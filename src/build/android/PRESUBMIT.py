@@ -95,6 +95,7 @@ def CommonChecks(input_api, output_api):
           unit_tests=[
               J('.', 'list_class_verification_failures_test.py'),
               J('.', 'convert_dex_profile_tests.py'),
+              J('gyp', 'compile_resources_test.py'),
               J('gyp', 'create_unwind_table_tests.py'),
               J('gyp', 'dex_test.py'),
               J('gyp', 'extract_unwind_tables_tests.py'),
@@ -14,22 +14,30 @@ This will crunch images with aapt2.
 
 import argparse
 import collections
+import concurrent.futures
 import contextlib
+import errno
 import filecmp
+import fnmatch
+import functools
 import hashlib
+import itertools
+import json
 import logging
 import os
-import pathlib
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
 import textwrap
+import zipfile
 from xml.etree import ElementTree
 
 from util import build_utils
 from util import diff_utils
 from util import manifest_utils
+from util import md5_check
 from util import parallel
 from util import protoresources
 from util import resource_utils
@@ -47,6 +55,18 @@ _PNG_WEBP_EXCLUSION_PATTERN = re.compile('|'.join([
     r'.*daydream_icon_.*\.png'
 ]))
 
+# The set of cwebp arguments that will appear in webp cache keys.
+_CWEBP_QUALITY_ARGS = ['-m', '6', '-q', '100', '-lossless']
+
+# Included in webp cache keys so that entries created with a different hash
+# function are never reused.
+_WEBP_CACHE_HASH_NAME = 'blake2b'
+
+# os.umask() can only be read by setting it, which is done once at import time
+# rather than while other threads may be creating files.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 def _ParseArgs(args):
   """Parses command line options.
@@ -237,12 +257,58 @@ def _ParseArgs(args):
 
 
 def _IterFiles(root_dir):
-  for root, _, files in os.walk(root_dir):
-    for f in files:
-      yield os.path.join(root, f)
+  # Uses os.scandir() directly since this runs over every resource file, and
+  # DirEntry caches the file type so no extra stat() calls are needed.
+  # Like os.walk(), does not descend into symlinked directories.
+  dirs = [root_dir]
+  while dirs:
+    with os.scandir(dirs.pop()) as it:
+      for entry in it:
+        if not entry.is_dir():
+          yield entry.path
+        elif not entry.is_symlink():
+          dirs.append(entry.path)
+
+
+# Locale helpers are called for many files but see few distinct inputs.
+_ToChromiumLocaleName = functools.lru_cache(maxsize=None)(
+    resource_utils.ToChromiumLocaleName)
+_ToAndroidLocaleName = functools.lru_cache(maxsize=None)(
+    resource_utils.ToAndroidLocaleName)
+
+
+@functools.lru_cache(maxsize=None)
+def _FindLocaleInResourceDirName(dir_name):
+  """Returns the locale of string resource files within |dir_name|, or None."""
+  # The locale depends only on the name of the parent directory.
+  return resource_utils.FindLocaleInStringResourceFilePath(
+      os.path.join(dir_name, 'strings.xml'))
+
+
+def _FindLocaleInStringResourceFilePath(file_path):
+  """Memoized version of resource_utils.FindLocaleInStringResourceFilePath."""
+  if not file_path.endswith('.xml'):
+    return None
+  return _FindLocaleInResourceDirName(
+      os.path.basename(os.path.dirname(file_path)))
+
+
+def _ScanDepSubdirs(dep_subdirs):
+  """Lists the files of all resource directories in a single pass.
+
+  Args:
+    dep_subdirs: List of resource dependency directories.
+  Returns:
+    A list of [dep_subdir, path, locale] entries, where |locale| is the
+    Android locale of string resource files, or None for other files. Passes
+    that move or delete files update this list so that later passes do not need
+    to walk the directories again.
+  """
+  return [[d, f, _FindLocaleInStringResourceFilePath(f)]
+          for d in dep_subdirs for f in _IterFiles(d)]
 
 
-def _RenameLocaleResourceDirs(resource_dirs, path_info):
+def _RenameLocaleResourceDirs(dep_files, path_info):
   """Rename locale resource directories into standard names when necessary.
 
   This is necessary to deal with the fact that older Android releases only
@@ -266,46 +332,48 @@ def _RenameLocaleResourceDirs(resource_dirs, path_info):
       locale qualifier if possible (e.g. 'values-b+en+US/ -> values-en-rUS').
 
   Args:
-    resource_dirs: list of top-level resource directories.
+    dep_files: List of [dep_subdir, path, locale] entries, as returned by
+      _ScanDepSubdirs(). Entries of renamed files are updated in place.
   """
-  for resource_dir in resource_dirs:
-    ignore_dirs = {}
-    for path in _IterFiles(resource_dir):
-      locale = resource_utils.FindLocaleInStringResourceFilePath(path)
-      if not locale:
+  ignore_dirs = {}
+  for entry in dep_files:
+    resource_dir, path, locale = entry
+    if not locale:
+      continue
+    cr_locale = _ToChromiumLocaleName(locale)
+    if not cr_locale:
+      continue  # Unsupported Android locale qualifier!?
+    locale2 = _ToAndroidLocaleName(cr_locale)
+    if locale != locale2:
+      path2 = path.replace('/values-%s/' % locale, '/values-%s/' % locale2)
+      if path == path2:
+        raise Exception('Could not substitute locale %s for %s in %s' %
+                        (locale, locale2, path))
+
+      # Ignore rather than rename when the destination resources config
+      # already exists.
+      # e.g. some libraries provide both values-nb/ and values-no/.
+      # e.g. material design provides:
+      # * res/values-rUS/values-rUS.xml
+      # * res/values-b+es+419/values-b+es+419.xml
+      config_dir = os.path.dirname(path2)
+      already_has_renamed_config = ignore_dirs.get(config_dir)
+      if already_has_renamed_config is None:
+        # Cache the result of the first time the directory is encountered
+        # since subsequent encounters will find the directory already exists
+        # (due to the rename).
+        already_has_renamed_config = os.path.exists(config_dir)
+        ignore_dirs[config_dir] = already_has_renamed_config
+      if already_has_renamed_config:
         continue
-      cr_locale = resource_utils.ToChromiumLocaleName(locale)
-      if not cr_locale:
-        continue  # Unsupported Android locale qualifier!?
-      locale2 = resource_utils.ToAndroidLocaleName(cr_locale)
-      if locale != locale2:
-        path2 = path.replace('/values-%s/' % locale, '/values-%s/' % locale2)
-        if path == path2:
-          raise Exception('Could not substitute locale %s for %s in %s' %
-                          (locale, locale2, path))
-
-        # Ignore rather than rename when the destination resources config
-        # already exists.
-        # e.g. some libraries provide both values-nb/ and values-no/.
-        # e.g. material design provides:
-        # * res/values-rUS/values-rUS.xml
-        # * res/values-b+es+419/values-b+es+419.xml
-        config_dir = os.path.dirname(path2)
-        already_has_renamed_config = ignore_dirs.get(config_dir)
-        if already_has_renamed_config is None:
-          # Cache the result of the first time the directory is encountered
-          # since subsequent encounters will find the directory already exists
-          # (due to the rename).
-          already_has_renamed_config = os.path.exists(config_dir)
-          ignore_dirs[config_dir] = already_has_renamed_config
-        if already_has_renamed_config:
-          continue
-
-        build_utils.MakeDirectory(os.path.dirname(path2))
-        shutil.move(path, path2)
-        path_info.RegisterRename(
-            os.path.relpath(path, resource_dir),
-            os.path.relpath(path2, resource_dir))
+
+      build_utils.MakeDirectory(os.path.dirname(path2))
+      os.replace(path, path2)
+      path_info.RegisterRename(
+          os.path.relpath(path, resource_dir),
+          os.path.relpath(path2, resource_dir))
+      entry[1] = path2
+      entry[2] = locale2
 
 
 def _ToAndroidLocales(locale_allowlist):
@@ -314,11 +382,11 @@ def _ToAndroidLocales(locale_allowlist):
   Args:
     locale_allowlist: A list of Chromium locale names.
   Returns:
-    A set of matching Android config locale qualifier names.
+    A frozenset of matching Android config locale qualifier names.
   """
   ret = set()
   for locale in locale_allowlist:
-    locale = resource_utils.ToAndroidLocaleName(locale)
+    locale = _ToAndroidLocaleName(locale)
     if locale is None or ('-' in locale and '-r' not in locale):
       raise Exception('Unsupported Chromium locale name: %s' % locale)
     ret.add(locale)
@@ -326,7 +394,7 @@ def _ToAndroidLocales(locale_allowlist):
     language = locale.split('-')[0]
     ret.add(language)
 
-  return ret
+  return frozenset(ret)
 
 
 def _MoveImagesToNonMdpiFolders(res_root, path_info):
@@ -350,12 +418,15 @@ def _MoveImagesToNonMdpiFolders(res_root, path_info):
       src_file = os.path.join(src_dir, src_file_name)
       dst_file = os.path.join(dst_dir, src_file_name)
       assert not os.path.lexists(dst_file)
-      shutil.move(src_file, dst_file)
+      os.replace(src_file, dst_file)
       path_info.RegisterRename(
           os.path.relpath(src_file, res_root),
           os.path.relpath(dst_file, res_root))
 
 
+# Cached since _FixManifest() runs twice when verifying expectations, and each
+# call would otherwise run "aapt2 dump" on every jar candidate.
+@functools.lru_cache(maxsize=None)
 def _DeterminePlatformVersion(aapt2_path, jar_candidates):
   def maybe_extract_version(j):
     try:
@@ -415,7 +486,7 @@ def _FixManifest(options, temp_dir):
   manifest_node.set('package', fixed_package)
 
   platform_version_code, platform_version_name = _DeterminePlatformVersion(
-      options.aapt2_path, options.include_resources)
+      options.aapt2_path, tuple(options.include_resources))
   manifest_node.set('platformBuildVersionCode', platform_version_code)
   manifest_node.set('platformBuildVersionName', platform_version_name)
   if options.version_code:
@@ -464,26 +535,110 @@ def _CreateKeepPredicate(resource_exclusion_regex,
 
   # A simple predicate that only removes (returns False for) paths covered by
   # the exclusion regex or listed as exceptions.
-  return lambda path: (
-      not re.search(resource_exclusion_regex, path) or
-      build_utils.MatchesGlob(path, resource_exclusion_exceptions))
-
-
-def _ComputeSha1(path):
-  with open(path, 'rb') as f:
-    data = f.read()
-  return hashlib.sha1(data).hexdigest()
-
+  # The predicate is called for every resource file, so compile the regex once,
+  # and combine the exception globs into a single regex.
+  exclusion_search = re.compile(resource_exclusion_regex).search
+  if not resource_exclusion_exceptions:
+    return lambda path: not exclusion_search(path)
+  exceptions_match = re.compile('|'.join(
+      fnmatch.translate(g) for g in resource_exclusion_exceptions)).match
+  return lambda path: (not exclusion_search(path) or
+                       exceptions_match(path) is not None)
+
+
+def _ComputeFileHash(path):
+  """Returns a hex digest of the contents of |path|.
+
+  Used only as a cache and change-detection key. The file is hashed in chunks
+  to keep memory usage flat.
+  """
+  h = hashlib.blake2b(digest_size=16)
+  # Reads are already large, so skip the extra copy through a BufferedReader,
+  # and read into a single reused buffer.
+  buf = bytearray(1 << 20)
+  view = memoryview(buf)
+  with open(path, 'rb', buffering=0) as f:
+    if hasattr(os, 'posix_fadvise'):  # Not available on Mac / Windows.
+      os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    while size := f.readinto(buf):
+      h.update(view[:size])
+  return h.hexdigest()
+
+
+def _LoadJsonIndex(index_path):
+  """Returns the dict stored at |index_path|, or {} if there is none."""
+  try:
+    with open(index_path) as f:
+      return json.load(f)
+  except (OSError, ValueError):
+    return {}
+
+
+def _WriteJsonIndex(index_path, index):
+  """Atomically replaces the contents of |index_path| with |index|."""
+  with tempfile.NamedTemporaryFile('w',
+                                   dir=os.path.dirname(index_path),
+                                   delete=False) as f:
+    json.dump(index, f, sort_keys=True)
+  # NamedTemporaryFile() creates files that only the owner can read, so give it
+  # the mode that open() would.
+  os.chmod(f.name, 0o666 & ~_UMASK)
+  os.replace(f.name, index_path)
+
+
+def _UpdateJsonIndex(index_path, updates):
+  """Merges |updates| into the index at |index_path|.
+
+  The index is re-read right before writing. Updates from concurrent builds may
+  be lost, which only costs recomputing them on the next build.
+  """
+  index = _LoadJsonIndex(index_path)
+  index.update(updates)
+  _WriteJsonIndex(index_path, index)
 
-def _ConvertToWebPSingle(png_path, cwebp_binary, cwebp_version, webp_cache_dir):
-  sha1_hash = _ComputeSha1(png_path)
 
-  # The set of arguments that will appear in the cache key.
-  quality_args = ['-m', '6', '-q', '100', '-lossless']
+def _GetCwebpVersion(cwebp_binary, webp_cache_dir):
+  """Returns the output of "cwebp -version".
 
-  webp_cache_path = os.path.join(
-      webp_cache_dir, '{}-{}-{}'.format(sha1_hash, cwebp_version,
-                                        ''.join(quality_args)))
+  The result is stored in |webp_cache_dir| keyed by the binary's path and stat
+  so that cwebp needs to be run only when it changes.
+  """
+  st = os.stat(cwebp_binary)
+  key = '{}:{}:{}'.format(os.path.abspath(cwebp_binary), st.st_mtime_ns,
+                          st.st_size)
+  index_path = os.path.join(webp_cache_dir, '.cwebp_version.json')
+  version = _LoadJsonIndex(index_path).get(key)
+  if version is None:
+    version = subprocess.check_output([cwebp_binary, '-version']).rstrip()
+    version = version.decode('utf-8')
+    _UpdateJsonIndex(index_path, {key: version})
+  return version
+
+
+def _WebPCachePath(webp_cache_dir, file_hash, cwebp_version):
+  return os.path.join(
+      webp_cache_dir,
+      '{}{}-{}-{}'.format(_WEBP_CACHE_HASH_NAME, file_hash, cwebp_version,
+                          ''.join(_CWEBP_QUALITY_ARGS)))
+
+
+def _LookUpWebPHashIndex(hash_index, png_path, stamp):
+  """Returns the hash of |png_path| from |hash_index|, or None if unknown."""
+  # |stamp| changes whenever the .zip the png was extracted from changes, so
+  # a matching entry means the png's contents are the same as last time.
+  index_entry = hash_index.get(png_path)
+  if index_entry and index_entry[0] == stamp:
+    return index_entry[1]
+  return None
+
+
+def _ConvertToWebPSingle(png_path, stamp, cwebp_binary, cwebp_version,
+                         webp_cache_dir, hash_index):
+  file_hash = _LookUpWebPHashIndex(hash_index, png_path, stamp)
+  if file_hash is None:
+    file_hash = _ComputeFileHash(png_path)
+
+  webp_cache_path = _WebPCachePath(webp_cache_dir, file_hash, cwebp_version)
   # No need to add .webp. Android can load images fine without them.
   webp_path = os.path.splitext(png_path)[0]
 
@@ -493,7 +648,8 @@ def _ConvertToWebPSingle(png_path, cwebp_binary, cwebp_version, webp_cache_dir):
   else:
     # We place the generated webp image to webp_path, instead of in the
     # webp_cache_dir to avoid concurrency issues.
-    args = [cwebp_binary, png_path, '-o', webp_path, '-quiet'] + quality_args
+    args = [cwebp_binary, png_path, '-o', webp_path, '-quiet']
+    args += _CWEBP_QUALITY_ARGS
     subprocess.check_call(args)
 
     try:
@@ -507,26 +663,83 @@ def _ConvertToWebPSingle(png_path, cwebp_binary, cwebp_version, webp_cache_dir):
   original_dir = os.path.dirname(os.path.dirname(png_path))
   rename_tuple = (os.path.relpath(png_path, original_dir),
                   os.path.relpath(webp_path, original_dir))
-  return rename_tuple, cache_hit
+  return rename_tuple, cache_hit, file_hash
 
 
-def _ConvertToWebP(cwebp_binary, png_paths, path_info, webp_cache_dir):
-  cwebp_version = subprocess.check_output([cwebp_binary, '-version']).rstrip()
-  shard_args = [(f, ) for f in png_paths
-                if not _PNG_WEBP_EXCLUSION_PATTERN.match(f)]
+def _ConvertToWebPBatch(batch, cwebp_binary, cwebp_version, webp_cache_dir,
+                        hash_index):
+  """Runs _ConvertToWebPSingle() for each (png_path, stamp) in |batch|."""
+  return [
+      _ConvertToWebPSingle(png_path, stamp, cwebp_binary, cwebp_version,
+                           webp_cache_dir, hash_index)
+      for png_path, stamp in batch
+  ]
+
 
+def _WebPHashIndexPath(webp_cache_dir, deps_dir):
+  """Returns the path of the png hash index for the target using |deps_dir|.
+
+  Each target has its own index, since the pngs of a target are always
+  extracted to the same paths under its |deps_dir|.
+  """
+  name = hashlib.blake2b(os.path.abspath(deps_dir).encode('utf-8'),
+                         digest_size=16).hexdigest()
+  return os.path.join(webp_cache_dir, 'png_hash_index', name + '.json')
+
+
+def _ConvertToWebP(cwebp_binary, png_paths, path_info, webp_cache_dir,
+                   dep_subdir_stamps, hash_index_path):
   build_utils.MakeDirectory(webp_cache_dir)
-  results = parallel.BulkForkAndCall(_ConvertToWebPSingle,
-                                     shard_args,
-                                     cwebp_binary=cwebp_binary,
-                                     cwebp_version=cwebp_version,
-                                     webp_cache_dir=webp_cache_dir)
+  build_utils.MakeDirectory(os.path.dirname(hash_index_path))
+  cwebp_version = _GetCwebpVersion(cwebp_binary, webp_cache_dir)
+  # Pngs are always at {dep_subdir}/{resource_type_dir}/{name}.png.
+  shard_args = [(f, dep_subdir_stamps[os.path.dirname(os.path.dirname(f))])
+                for f in png_paths]
+
+  hash_index = _LoadJsonIndex(hash_index_path)
+
+  # Pngs that are unchanged since the last build and whose webp is still
+  # cached need only a hard link, which is cheaper to do here than to schedule
+  # on a worker.
+  local_args = []
+  worker_args = []
+  for png_path, stamp in shard_args:
+    file_hash = _LookUpWebPHashIndex(hash_index, png_path, stamp)
+    if file_hash is not None and os.path.exists(
+        _WebPCachePath(webp_cache_dir, file_hash, cwebp_version)):
+      local_args.append((png_path, stamp))
+    else:
+      worker_args.append((png_path, stamp))
+  local_results = _ConvertToWebPBatch(local_args, cwebp_binary, cwebp_version,
+                                      webp_cache_dir, hash_index)
+
+  # Converting a single png is quick (especially on cache hits), so send pngs
+  # to workers in batches to amortize the per-job overhead.
+  batch_size = max(1, len(worker_args) // ((os.cpu_count() or 1) * 4))
+  batches = [(worker_args[i:i + batch_size], )
+             for i in range(0, len(worker_args), batch_size)]
+  worker_results = itertools.chain.from_iterable(
+      parallel.BulkForkAndCall(_ConvertToWebPBatch,
+                               batches,
+                               cwebp_binary=cwebp_binary,
+                               cwebp_version=cwebp_version,
+                               webp_cache_dir=webp_cache_dir,
+                               hash_index=hash_index))
+  results = itertools.chain(local_results, worker_results)
   total_cache_hits = 0
-  for rename_tuple, cache_hit in results:
+  new_hash_index = {}
+  for (png_path, stamp), (rename_tuple, cache_hit, file_hash) in zip(
+      local_args + worker_args, results):
     path_info.RegisterRename(*rename_tuple)
     total_cache_hits += int(cache_hit)
+    new_hash_index[png_path] = [stamp, file_hash]
 
-  logging.debug('png->webp cache: %d/%d', total_cache_hits, len(shard_args))
+  # Only this target's current pngs are written, so entries for pngs that are
+  # gone are dropped.
+  if new_hash_index != hash_index:
+    _WriteJsonIndex(hash_index_path, new_hash_index)
+  logging.debug('png->webp cache: %d/%d (%d without a worker)',
+                total_cache_hits, len(shard_args), len(local_args))
 
 
 def _RemoveImageExtensions(directory, path_info):
@@ -540,12 +753,34 @@ def _RemoveImageExtensions(directory, path_info):
       path_with_extension = f
       path_no_extension = os.path.splitext(path_with_extension)[0]
       if path_no_extension != path_with_extension:
-        shutil.move(path_with_extension, path_no_extension)
+        os.replace(path_with_extension, path_no_extension)
         path_info.RegisterRename(
             os.path.relpath(path_with_extension, directory),
             os.path.relpath(path_no_extension, directory))
 
 
+class _RenameRecorder:
+  """Buffers RegisterRename() calls made from a worker thread."""
+
+  def __init__(self):
+    self.renames = []
+
+  def RegisterRename(self, old_archive_path, new_archive_path):
+    self.renames.append((old_archive_path, new_archive_path))
+
+
+def _ApplyDrawableTransformations(directory):
+  """Applies drawable transformations to |directory|.
+
+  Returns:
+    A _RenameRecorder containing the renames that were made.
+  """
+  recorder = _RenameRecorder()
+  _MoveImagesToNonMdpiFolders(directory, recorder)
+  _RemoveImageExtensions(directory, recorder)
+  return recorder
+
+
 def _CompileSingleDep(index, dep_subdir, keep_predicate, aapt2_path,
                       partials_dir):
   unique_name = '{}_{}'.format(index, os.path.basename(dep_subdir))
@@ -586,8 +821,8 @@ def _CreateValuesKeepPredicate(exclusion_rules, dep_subdir):
   if not patterns:
     return None
 
-  regexes = [re.compile(p) for p in patterns]
-  return lambda x: not any(r.search(x) for r in regexes)
+  searches = tuple(re.compile(p).search for p in patterns)
+  return lambda x: not any(search(x) for search in searches)
 
 
 def _CompileDeps(aapt2_path, dep_subdirs, dep_subdir_overlay_set, temp_dir,
@@ -624,22 +859,21 @@ def _CreateResourceInfoFile(path_info, info_path, dependencies_res_zips):
   path_info.Write(info_path)
 
 
-def _RemoveUnwantedLocalizedStrings(dep_subdirs, options):
+def _RemoveUnwantedLocalizedStrings(dep_files, options):
   """Remove localized strings that should not go into the final output.
 
   Args:
-    dep_subdirs: List of resource dependency directories.
+    dep_files: List of [dep_subdir, path, locale] entries, as returned by
+      _ScanDepSubdirs().
     options: Command-line options namespace.
   """
   # Collect locale and file paths from the existing subdirs.
   # The following variable maps Android locale names to
   # sets of corresponding xml file paths.
   locale_to_files_map = collections.defaultdict(set)
-  for directory in dep_subdirs:
-    for f in _IterFiles(directory):
-      locale = resource_utils.FindLocaleInStringResourceFilePath(f)
-      if locale:
-        locale_to_files_map[locale].add(f)
+  for _, f, locale in dep_files:
+    if locale:
+      locale_to_files_map[locale].add(f)
 
   all_locales = set(locale_to_files_map)
 
@@ -664,37 +898,66 @@ def _RemoveUnwantedLocalizedStrings(dep_subdirs, options):
   # Remove any file that belongs to a locale not covered by
   # either A or B.
   removable_locales = (all_locales - wanted_locales - shared_resources_locales)
-  for locale in removable_locales:
-    for path in locale_to_files_map[locale]:
-      os.remove(path)
+  to_delete = [
+      path for locale in removable_locales
+      for path in locale_to_files_map[locale]
+  ]
 
   # For any locale in B but not in A, only keep the shared
   # resource strings in each file.
-  for locale in shared_resources_locales - wanted_locales:
-    for path in locale_to_files_map[locale]:
-      resource_utils.FilterAndroidResourceStringsXml(
-          path, lambda x: x in shared_names_allowlist)
+  keep_shared_paths = [
+      path for locale in shared_resources_locales - wanted_locales
+      for path in locale_to_files_map[locale]
+  ]
 
   # For any locale in A but not in B, only keep the strings
   # that are _not_ from shared resources in the file.
-  for locale in wanted_locales - shared_resources_locales:
-    for path in locale_to_files_map[locale]:
-      resource_utils.FilterAndroidResourceStringsXml(
-          path, lambda x: x not in shared_names_allowlist)
+  drop_shared_paths = [
+      path for locale in wanted_locales - shared_resources_locales
+      for path in locale_to_files_map[locale]
+  ]
+
+  def is_shared(name):
+    return name in shared_names_allowlist
+
+  def is_not_shared(name):
+    return name not in shared_names_allowlist
+
+  # Each path is touched by exactly one of the jobs below, and both unlink()
+  # and file I/O release the GIL, so they can all run concurrently.
+  with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+    futures = [executor.submit(os.unlink, path) for path in to_delete]
+    futures += [
+        executor.submit(resource_utils.FilterAndroidResourceStringsXml, path,
+                        is_shared) for path in keep_shared_paths
+    ]
+    futures += [
+        executor.submit(resource_utils.FilterAndroidResourceStringsXml, path,
+                        is_not_shared) for path in drop_shared_paths
+    ]
+    # Re-raise the first error, if any.
+    for future in futures:
+      future.result()
 
 
-def _FilterResourceFiles(dep_subdirs, keep_predicate):
+def _FilterResourceFiles(dep_files, keep_predicate):
   # Create a function that selects which resource files should be packaged
   # into the final output. Any file that does not pass the predicate will
-  # be removed below.
+  # be removed below, along with its |dep_files| entry.
+  # Also collects the pngs that may be converted to webp.
   png_paths = []
-  for directory in dep_subdirs:
-    for f in _IterFiles(directory):
-      if not keep_predicate(f):
-        os.remove(f)
-      elif f.endswith('.png'):
-        png_paths.append(f)
+  kept_files = []
+  is_webp_excluded = _PNG_WEBP_EXCLUSION_PATTERN.match
+  for entry in dep_files:
+    f = entry[1]
+    if not keep_predicate(f):
+      os.remove(f)
+      continue
+    kept_files.append(entry)
+    if f.endswith('.png') and not is_webp_excluded(f):
+      png_paths.append(f)
 
+  dep_files[:] = kept_files
   return png_paths
 
 
@@ -710,34 +973,48 @@ def _PackageApk(options, build):
   logging.debug('Extracting resource .zips')
   dep_subdirs = []
   dep_subdir_overlay_set = set()
+  # Identifies the contents of each dep subdir by the stat of its .zip.
+  dep_subdir_stamps = {}
   for dependency_res_zip in options.dependencies_res_zips:
     extracted_dep_subdirs = resource_utils.ExtractDeps([dependency_res_zip],
                                                        build.deps_dir)
     dep_subdirs += extracted_dep_subdirs
+    zip_stat = os.stat(dependency_res_zip)
+    dep_subdir_stamps.update(
+        dict.fromkeys(extracted_dep_subdirs,
+                      '{}:{}'.format(zip_stat.st_mtime_ns, zip_stat.st_size)))
     if dependency_res_zip in options.dependencies_res_zip_overlays:
       dep_subdir_overlay_set.update(extracted_dep_subdirs)
 
+  logging.debug('Listing resource files')
+  dep_files = _ScanDepSubdirs(dep_subdirs)
+
   logging.debug('Applying locale transformations')
   path_info = resource_utils.ResourceInfoFile()
-  _RenameLocaleResourceDirs(dep_subdirs, path_info)
+  _RenameLocaleResourceDirs(dep_files, path_info)
 
   logging.debug('Applying file-based exclusions')
   keep_predicate = _CreateKeepPredicate(options.resource_exclusion_regex,
                                         options.resource_exclusion_exceptions)
-  png_paths = _FilterResourceFiles(dep_subdirs, keep_predicate)
+  png_paths = _FilterResourceFiles(dep_files, keep_predicate)
 
   if options.locale_allowlist or options.shared_resources_allowlist_locales:
     logging.debug('Applying locale-based string exclusions')
-    _RemoveUnwantedLocalizedStrings(dep_subdirs, options)
+    _RemoveUnwantedLocalizedStrings(dep_files, options)
 
   if png_paths and options.png_to_webp:
     logging.debug('Converting png->webp')
     _ConvertToWebP(options.webp_binary, png_paths, path_info,
-                   options.webp_cache_dir)
+                   options.webp_cache_dir, dep_subdir_stamps,
+                   _WebPHashIndexPath(options.webp_cache_dir, build.deps_dir))
   logging.debug('Applying drawable transformations')
-  for directory in dep_subdirs:
-    _MoveImagesToNonMdpiFolders(directory, path_info)
-    _RemoveImageExtensions(directory, path_info)
+  # Each directory is independent and the work is mostly file system calls,
+  # so use threads. Renames are registered in |dep_subdirs| order to keep the
+  # .res.info file deterministic.
+  with concurrent.futures.ThreadPoolExecutor() as executor:
+    for recorder in executor.map(_ApplyDrawableTransformations, dep_subdirs):
+      for rename_tuple in recorder.renames:
+        path_info.RegisterRename(*rename_tuple)
 
   logging.debug('Running aapt2 compile')
   exclusion_rules = [x.split(':', 1) for x in options.values_filter_rules]
@@ -816,33 +1093,40 @@ def _PackageApk(options, build):
   assert exit_code == 0, f'aapt2 link cmd failed with {exit_code=}'
   logging.debug('Finished: aapt2 link')
 
-  if options.shared_resources:
-    logging.debug('Resolving styleables in R.txt')
-    # Need to resolve references because unused resource removal tool does not
-    # support references in R.txt files.
-    resource_utils.ResolveStyleableReferences(build.r_txt_path)
-
   if exit_code:
     raise subprocess.CalledProcessError(exit_code, link_command)
 
-  if options.proguard_file and (options.shared_resources
-                                or options.app_as_shared_lib):
-    # Make sure the R class associated with the manifest package does not have
-    # its onResourcesLoaded method obfuscated or removed, so that the framework
-    # can call it in the case where the APK is being loaded as a library.
-    with open(build.proguard_path, 'a') as proguard_file:
-      keep_rule = '''
-                  -keep,allowoptimization class {package}.R {{
-                    public static void onResourcesLoaded(int);
-                  }}
-                  '''.format(package=desired_manifest_package_name)
-      proguard_file.write(textwrap.dedent(keep_rule))
-
-  logging.debug('Running aapt2 convert')
-  build_utils.CheckOutput([
-      options.aapt2_path, 'convert', '--output-format', 'proto', '-o',
-      build.proto_path, build.arsc_path
-  ])
+  # The arsc -> proto conversion only reads the .arsc file, so run it on a
+  # worker thread while updating R.txt and the proguard file below.
+  logging.debug('Starting: aapt2 convert')
+  with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+    convert_future = executor.submit(build_utils.CheckOutput, [
+        options.aapt2_path, 'convert', '--output-format', 'proto', '-o',
+        build.proto_path, build.arsc_path
+    ])
+
+    if options.shared_resources:
+      logging.debug('Resolving styleables in R.txt')
+      # Need to resolve references because unused resource removal tool does
+      # not support references in R.txt files.
+      resource_utils.ResolveStyleableReferences(build.r_txt_path)
+
+    if options.proguard_file and (options.shared_resources
+                                  or options.app_as_shared_lib):
+      # Make sure the R class associated with the manifest package does not
+      # have its onResourcesLoaded method obfuscated or removed, so that the
+      # framework can call it in the case where the APK is being loaded as a
+      # library.
+      with open(build.proguard_path, 'a') as proguard_file:
+        keep_rule = '''
+                    -keep,allowoptimization class {package}.R {{
+                      public static void onResourcesLoaded(int);
+                    }}
+                    '''.format(package=desired_manifest_package_name)
+        proguard_file.write(textwrap.dedent(keep_rule))
+
+    convert_future.result()
+  logging.debug('Finished: aapt2 convert')
 
   # Workaround for b/147674078. This is only needed for WebLayer and does not
   # affect WebView usage, since WebView does not used dynamic attributes.
@@ -878,17 +1162,68 @@ def _CreateStableIdsFile(in_path, out_path, package_name, package_id):
   package. To make it work for other packages, we need to transform the package
   name references to match the package that resources are being generated for.
   """
-  if in_path:
-    data = pathlib.Path(in_path).read_text()
-  else:
-    # Force IDs to use 0x01 for the type byte in order to ensure they are
-    # different from IDs generated by other apps. https://crbug.com/1293336
-    data = 'pkg:id/fake_resource_id = 0x7f010000\n'
-  # Replace "pkg:" with correct package name.
-  data = re.sub(r'^.*?:', package_name + ':', data, flags=re.MULTILINE)
+  package_prefix = package_name.encode('utf-8') + b':'
+  package_id_bytes = b'0x%02x' % package_id
   # Replace "0x7f" with correct package id.
-  data = re.sub(r'0x..', '0x%02x' % package_id, data)
-  pathlib.Path(out_path).write_text(data)
+  package_id_pattern = re.compile(rb'0x..')
+
+  def transform_lines(lines):
+    for line in lines:
+      # Replace "pkg:" with correct package name.
+      _, sep, rest = line.partition(b':')
+      if sep:
+        line = package_prefix + rest
+      yield package_id_pattern.sub(package_id_bytes, line)
+
+  with open(out_path, 'wb', buffering=1 << 20) as out_file:
+    if in_path:
+      with open(in_path, 'rb', buffering=1 << 20) as in_file:
+        out_file.writelines(transform_lines(in_file))
+    else:
+      # Force IDs to use 0x01 for the type byte in order to ensure they are
+      # different from IDs generated by other apps. https://crbug.com/1293336
+      out_file.writelines(
+          transform_lines([b'pkg:id/fake_resource_id = 0x7f010000\n']))
+
+
+def _ZipGeneratedSources(output, base_dir):
+  """Zips the generated files in |base_dir| into |output|.
+
+  Equivalent to zip_helpers.zip_directory() for generated sources (which are
+  neither symlinks nor executable), but reads files on a thread pool while
+  entries are added in sorted order.
+  """
+  paths = sorted(
+      (os.path.relpath(p, base_dir).replace(os.sep, '/'), p)
+      for p in _IterFiles(base_dir))
+
+  def read_file(path):
+    with open(path, 'rb') as f:
+      return f.read()
+
+  with concurrent.futures.ThreadPoolExecutor() as executor, \
+      zipfile.ZipFile(output, 'w') as out_zip:
+    datas = executor.map(read_file, (p for _, p in paths))
+    for (zip_path, _), data in zip(paths, datas):
+      zip_helpers.add_to_zip_hermetic(out_zip, zip_path, data=data)
+
+
+def _MoveOutput(temp, final):
+  try:
+    os.replace(temp, final)
+  except OSError as e:
+    # The temp dir can be on another filesystem when TEMP_RESOURCES_DIR is set.
+    if e.errno != errno.EXDEV:
+      raise
+    # Uses os.sendfile() where available, so the copy stays in the kernel.
+    shutil.copyfile(temp, final)
+    os.unlink(temp)
+
+
+def _MaybeMoveOutput(final, temp):
+  # Write file only if it's changed.
+  if not (os.path.exists(final) and filecmp.cmp(final, temp)):
+    _MoveOutput(temp, final)
 
 
 def _WriteOutputs(options, build):
@@ -902,10 +1237,15 @@ def _WriteOutputs(options, build):
       (options.info_path, build.info_path),
   ]
 
-  for final, temp in possible_outputs:
-    # Write file only if it's changed.
-    if final and not (os.path.exists(final) and filecmp.cmp(final, temp)):
-      shutil.move(temp, final)
+  # Outputs are independent of one another, so compare and move them
+  # concurrently.
+  with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+    futures = [
+        executor.submit(_MaybeMoveOutput, final, temp)
+        for final, temp in possible_outputs if final
+    ]
+    for future in futures:
+      future.result()
 
 
 def _CreateNormalizedManifestForVerification(options):
@@ -917,17 +1257,7 @@ def _CreateNormalizedManifestForVerification(options):
           options.verification_library_version_offset)
 
 
-def main(args):
-  build_utils.InitLogging('RESOURCE_DEBUG')
-  args = build_utils.ExpandFileArgs(args)
-  options = _ParseArgs(args)
-
-  if options.expected_file:
-    actual_data = _CreateNormalizedManifestForVerification(options)
-    diff_utils.CheckExpectations(actual_data, options)
-    if options.only_verify_expectations:
-      return
-
+def _OnStaleMd5(options):
   path = options.arsc_path or options.proto_path
   debug_temp_resources_dir = os.environ.get('TEMP_RESOURCES_DIR')
   if debug_temp_resources_dir:
@@ -997,18 +1327,65 @@ def main(args):
                                       custom_root_package_name,
                                       grandparent_custom_package_name)
       with action_helpers.atomic_output(build.srcjar_path) as f:
-        zip_helpers.zip_directory(f, build.srcjar_dir)
+        _ZipGeneratedSources(f, build.srcjar_dir)
 
     logging.debug('Copying outputs')
     _WriteOutputs(options, build)
 
+
+def main(args):
+  build_utils.InitLogging('RESOURCE_DEBUG')
+  args = build_utils.ExpandFileArgs(args)
+  options = _ParseArgs(args)
+
+  if options.expected_file:
+    actual_data = _CreateNormalizedManifestForVerification(options)
+    diff_utils.CheckExpectations(actual_data, options)
+    if options.only_verify_expectations:
+      return
+
   if options.depfile:
     assert options.srcjar_out, 'Update first output below and remove assert.'
-    depfile_deps = (options.dependencies_res_zips +
-                    options.dependencies_res_zip_overlays +
-                    options.include_resources)
-    action_helpers.write_depfile(options.depfile, options.srcjar_out,
-                                 depfile_deps)
+
+  # Order of these must match order specified in GN so that the correct one
+  # appears first in the depfile.
+  output_paths = [
+      p for p in (options.srcjar_out, options.r_text_out, options.arsc_path,
+                  options.proto_path, options.proguard_file,
+                  options.emit_ids_out, options.info_path) if p
+  ]
+
+  input_paths = (options.dependencies_res_zips + options.include_resources +
+                 [options.aapt2_path, options.android_manifest])
+  for path in (options.shared_resources_allowlist,
+               options.use_resource_ids_path):
+    if path:
+      input_paths.append(path)
+  if options.png_to_webp:
+    input_paths.append(options.webp_binary)
+  if options.info_path:
+    input_paths += [
+        p + '.info' for p in options.dependencies_res_zips
+        if os.path.exists(p + '.info')
+    ]
+
+  # Every flag can affect the outputs, so record the whole command line.
+  input_strings = args
+
+  depfile_deps = (options.dependencies_res_zips +
+                  options.dependencies_res_zip_overlays +
+                  options.include_resources)
+
+  # Dependency .zip files are often rebuilt with identical contents, so
+  # md5_check is used to skip re-linking when real inputs have not changed.
+  # The .md5.stamp it writes is declared as an output in
+  # //build/config/siso/android.star so that remote builds bring it back.
+  md5_check.CallAndWriteDepfileIfStale(lambda: _OnStaleMd5(options),
+                                       options,
+                                       input_paths=input_paths,
+                                       input_strings=input_strings,
+                                       output_paths=output_paths,
+                                       depfile_deps=depfile_deps)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# Copyright 2026 The Chromium Authors
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import json
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+import compile_resources
+
+# Copies the input png to the output path, which is enough for the cache logic.
+_FAKE_CWEBP = """\
+#!/bin/sh
+if [ "$1" = -version ]; then
+  echo 1.0
+  exit 0
+fi
+cp "$1" "$3"
+"""
+
+
+def _ReadFile(path):
+  with open(path) as f:
+    return f.read()
+
+
+def _WriteFile(path, data):
+  os.makedirs(os.path.dirname(path), exist_ok=True)
+  with open(path, 'w') as f:
+    f.write(data)
+
+
+class WebPCacheTest(unittest.TestCase):
+  def setUp(self):
+    temp_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(temp_dir.cleanup)
+    self.temp_dir = temp_dir.name
+    self.cwebp = os.path.join(self.temp_dir, 'cwebp')
+    _WriteFile(self.cwebp, _FAKE_CWEBP)
+    os.chmod(self.cwebp, os.stat(self.cwebp).st_mode | stat.S_IXUSR)
+    self.cache_dir = os.path.join(self.temp_dir, 'cache')
+    self.deps_dir = os.path.join(self.temp_dir, 'deps')
+    self.dep_subdir = os.path.join(self.deps_dir, '0')
+    self.index_path = compile_resources._WebPHashIndexPath(
+        self.cache_dir, self.deps_dir)
+
+  def _Convert(self, pngs, stamp):
+    """Converts |pngs| (a dict of name to contents) as a fresh build would.
+
+    Returns:
+      A dict of name to the contents of the resulting webp file.
+    """
+    shutil.rmtree(self.deps_dir, ignore_errors=True)
+    png_paths = []
+    for name, data in pngs.items():
+      png_path = os.path.join(self.dep_subdir, 'drawable', name + '.png')
+      _WriteFile(png_path, data)
+      png_paths.append(png_path)
+    compile_resources._ConvertToWebP(self.cwebp, png_paths,
+                                     compile_resources._RenameRecorder(),
+                                     self.cache_dir, {self.dep_subdir: stamp},
+                                     self.index_path)
+    return {
+        name: _ReadFile(os.path.join(self.dep_subdir, 'drawable', name))
+        for name in pngs
+    }
+
+  def testHashIndexHit(self):
+    self.assertEqual(self._Convert({'icon': 'old'}, '1'), {'icon': 'old'})
+    # An unchanged stamp means the png is not hashed again, so the cached webp
+    # of the indexed hash is used.
+    self.assertEqual(self._Convert({'icon': 'new'}, '1'), {'icon': 'old'})
+
+  def testHashIndexMiss(self):
+    self.assertEqual(self._Convert({'icon': 'old'}, '1'), {'icon': 'old'})
+    self.assertEqual(self._Convert({'icon': 'new'}, '2'), {'icon': 'new'})
+
+  def testHashIndexDropsRemovedPngs(self):
+    self._Convert({'icon': 'a', 'logo': 'b'}, '1')
+    self._Convert({'logo': 'b'}, '2')
+
+    index = json.loads(_ReadFile(self.index_path))
+    self.assertEqual(list(index),
+                     [os.path.join(self.dep_subdir, 'drawable', 'logo.png')])
+
+  def testHashIndexHasDefaultMode(self):
+    self._Convert({'icon': 'a'}, '1')
+
+    mode = stat.S_IMODE(os.stat(self.index_path).st_mode)
+    self.assertEqual(mode, 0o666 & ~compile_resources._UMASK)
+
+  def testHashIndexIsPerTarget(self):
+    other_index_path = compile_resources._WebPHashIndexPath(
+        self.cache_dir, os.path.join(self.temp_dir, 'other_deps'))
+    self.assertNotEqual(self.index_path, other_index_path)
+
+
+class WriteOutputsTest(unittest.TestCase):
+  def setUp(self):
+    temp_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(temp_dir.cleanup)
+    self.final = os.path.join(temp_dir.name, 'final')
+    self.temp = os.path.join(temp_dir.name, 'temp')
+
+  def testUnchangedOutputIsNotMoved(self):
+    _WriteFile(self.final, 'data')
+    _WriteFile(self.temp, 'data')
+    final_inode = os.stat(self.final).st_ino
+
+    compile_resources._MaybeMoveOutput(self.final, self.temp)
+
+    self.assertEqual(os.stat(self.final).st_ino, final_inode)
+    self.assertTrue(os.path.exists(self.temp))
+
+  def testChangedOutputIsMoved(self):
+    _WriteFile(self.final, 'old')
+    _WriteFile(self.temp, 'new')
+
+    compile_resources._MaybeMoveOutput(self.final, self.temp)
+
+    self.assertEqual(_ReadFile(self.final), 'new')
+    self.assertFalse(os.path.exists(self.temp))
+
+  def testMissingOutputIsMoved(self):
+    _WriteFile(self.temp, 'new')
+
+    compile_resources._MaybeMoveOutput(self.final, self.temp)
+
+    self.assertEqual(_ReadFile(self.final), 'new')
+    self.assertEqual(os.listdir(os.path.dirname(self.final)), ['final'])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -9,8 +9,10 @@ https://cs.android.com/search?q=f:aapt2.*Resources.proto
 
 import logging
 import os
+import stat
 import struct
 import sys
+import tempfile
 import zipfile
 
 from util import build_utils
@@ -38,22 +40,35 @@ SHARED_LIBRARY_HARDCODED_ID = 36
 
 def _ProcessZip(zip_path, process_func):
   """Filters a .zip file via: new_bytes = process_func(filename, data)."""
-  has_changes = False
-  zip_entries = []
   with zipfile.ZipFile(zip_path) as src_zip:
-    for info in src_zip.infolist():
+    infos = src_zip.infolist()
+    for first_changed, info in enumerate(infos):
       data = src_zip.read(info)
       new_data = process_func(info.filename, data)
       if new_data is not data:
-        has_changes = True
-        data = new_data
-      zip_entries.append((info, data))
-
-  # Overwrite the original zip file.
-  if has_changes:
-    with zipfile.ZipFile(zip_path, 'w') as f:
-      for info, data in zip_entries:
-        f.writestr(info, data)
+        break
+    else:
+      # Nothing changed, so leave the original zip file as is.
+      return
+
+    # Entries are streamed into a sibling file rather than held in memory.
+    tmp_file = tempfile.NamedTemporaryFile(dir=os.path.dirname(zip_path),
+                                           delete=False)
+    try:
+      with tmp_file, zipfile.ZipFile(tmp_file, 'w') as dst_zip:
+        # Entries before the first changed one are known to be unchanged.
+        for info in infos[:first_changed]:
+          dst_zip.writestr(info, src_zip.read(info))
+        dst_zip.writestr(infos[first_changed], new_data)
+        for info in infos[first_changed + 1:]:
+          dst_zip.writestr(info, process_func(info.filename,
+                                              src_zip.read(info)))
+      # NamedTemporaryFile() creates files that only the owner can read.
+      os.chmod(tmp_file.name, stat.S_IMODE(os.stat(zip_path).st_mode))
+    except BaseException:
+      os.unlink(tmp_file.name)
+      raise
+  os.replace(tmp_file.name, zip_path)
 
 
 def _ProcessProtoItem(item):
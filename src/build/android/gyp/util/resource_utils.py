@@ -969,7 +969,7 @@ def ParseAndroidResourceStringsFromXml(xml_data):
   m = re.search(r'<resources([^>]*)>', xml_data, re.MULTILINE)
   if not m:
     raise Exception('<resources> start tag expected: ' + xml_data)
-  input_data = xml_data[m.end():]
+  pos = m.end()
   resource_attrs = m.group(1)
   re_namespace = re.compile(r'\s*(xmlns:(\w+)="([^"]+)")')
   namespaces = {}
@@ -980,21 +980,22 @@ def ParseAndroidResourceStringsFromXml(xml_data):
     namespaces[m.group(2)] = m.group(3)
     resource_attrs = resource_attrs[m.end(1):]
 
-  # Find each string element now.
+  # Find each string element now. Searches start from |pos| rather than
+  # slicing off the consumed input, which would make this quadratic in the
+  # size of the file.
   re_string_element_start = re.compile(
       r'<string ([^>]* )?name="([^">]+)"[^>]*>')
   re_string_element_end = re.compile(r'</string>')
-  while input_data:
-    m = re_string_element_start.search(input_data)
+  while True:
+    m = re_string_element_start.search(xml_data, pos)
     if not m:
       break
     name = m.group(2)
-    input_data = input_data[m.end():]
-    m2 = re_string_element_end.search(input_data)
+    m2 = re_string_element_end.search(xml_data, m.end())
     if not m2:
-      raise Exception('Expected closing string tag: ' + input_data)
-    text = input_data[:m2.start()]
-    input_data = input_data[m2.end():]
+      raise Exception('Expected closing string tag: ' + xml_data[m.end():])
+    text = xml_data[m.end():m2.start()]
+    pos = m2.end()
     if len(text) != 0 and text[0] == '"' and text[-1] == '"':
       text = text[1:-1]
     result[name] = text
@@ -10,6 +10,7 @@ required for .isolate files.
 """
 
 import argparse
+import concurrent.futures
 import os
 import shlex
 import sys
@@ -26,8 +27,11 @@ def ComputePythonDependencies():
   A path is assumed to be a "system" import if it is outside of chromium's
   src/. The paths will be relative to the current directory.
   """
-  module_paths = (m.__file__ for m in sys.modules.values()
-                  if m and hasattr(m, '__file__') and m.__file__)
+  # The import machinery's own modules are never under src/, so skip them
+  # without touching their attributes.
+  module_paths = (m.__file__ for name, m in sys.modules.items()
+                  if m and not name.startswith(('_frozen_', 'importlib.'))
+                  and hasattr(m, '__file__') and m.__file__)
 
   src_paths = set()
   for path in module_paths:
@@ -37,8 +41,8 @@ def ComputePythonDependencies():
     if not path.startswith(_SRC_ROOT):
       continue
 
-    if (path.endswith('.pyc')
-        or (path.endswith('c') and not os.path.splitext(path)[1])):
+    if path.endswith('c') and (path.endswith('.pyc')
+                               or not os.path.splitext(path)[1]):
       path = path[:-1]
     src_paths.add(path)
 
@@ -73,11 +77,24 @@ def _NormalizeCommandLine(options):
 
 def _FindPythonInDirectory(directory, allow_test):
   """Returns an iterable of all non-test python files in the given directory."""
-  for root, _dirnames, filenames in os.walk(directory):
-    for filename in filenames:
-      if filename.endswith('.py') and (allow_test
-                                       or not filename.endswith('_test.py')):
-        yield os.path.join(root, filename)
+  # Uses os.scandir() directly since DirEntry caches the file type, avoiding
+  # the extra per-entry work of os.walk().
+  try:
+    it = os.scandir(directory)
+  except OSError:
+    # Like os.walk(), skip directories that are missing or unreadable.
+    return
+  with it:
+    for entry in it:
+      if entry.is_dir(follow_symlinks=False):
+        yield from _FindPythonInDirectory(entry.path, allow_test)
+      elif entry.name.endswith('.py') and (allow_test or
+                                           not entry.name.endswith('_test.py')):
+        yield entry.path
+
+
+def _ModuleNameForPath(module_path):
+  return os.path.splitext(os.path.basename(module_path))[0]
 
 
 def _ImportModuleByPath(module_path):
@@ -87,7 +104,7 @@ def _ImportModuleByPath(module_path):
   sys.path[0] = os.path.dirname(module_path)
 
   # https://docs.python.org/3/library/importlib.html#importing-a-source-file-directly
-  module_name = os.path.splitext(os.path.basename(module_path))[0]
+  module_name = _ModuleNameForPath(module_path)
   import importlib.util  # Python 3 only, since it's unavailable in Python 2.
   spec = importlib.util.spec_from_file_location(module_name, module_path)
   module = importlib.util.module_from_spec(spec)
@@ -96,6 +113,10 @@ def _ImportModuleByPath(module_path):
 
 
 def main():
+  # Modules are only imported to discover their dependencies, so don't write
+  # .pyc files for them.
+  sys.dont_write_bytecode = True
+
   parser = argparse.ArgumentParser(
       description='Prints all non-system dependencies for the given module.')
   parser.add_argument('module',
@@ -130,12 +151,7 @@ def main():
     options.output = options.module + 'deps'
     options.root = os.path.dirname(options.module)
 
-  modules = [options.module]
-  if os.path.isdir(options.module):
-    modules = list(_FindPythonInDirectory(options.module, allow_test=True))
-  if not modules:
-    parser.error('Input directory does not contain any python files!')
-
+  # Relaunch before finding modules, since that work would all be redone.
   is_vpython = 'vpython' in sys.executable
   if not is_vpython:
     # Prevent infinite relaunch if something goes awry.
@@ -144,7 +160,15 @@ def main():
     # //.vpython, but does not cause it to pick up modules defined inline via
     # [VPYTHON:BEGIN] ... [VPYTHON:END] comments.
     # TODO(agrieve): Add support for this if the need ever arises.
-    os.execvp('vpython3', ['vpython3'] + sys.argv + ['--did-relaunch'])
+    os.execvpe('vpython3', ['vpython3'] + sys.argv + ['--did-relaunch'], {
+        **os.environ, 'PYTHONDONTWRITEBYTECODE': '1'
+    })
+
+  modules = [options.module]
+  if os.path.isdir(options.module):
+    modules = list(_FindPythonInDirectory(options.module, allow_test=True))
+  if not modules:
+    parser.error('Input directory does not contain any python files!')
 
   # Work-around for protobuf library not being loadable via importlib
   # This is needed due to compile_resources.py.
@@ -154,8 +178,12 @@ def main():
   paths_set = set()
   try:
     for module in modules:
+      # Loaded modules stay in sys.modules, so it only needs to be scanned
+      # before an entry is about to be replaced by a module of the same name.
+      if _ModuleNameForPath(module) in sys.modules:
+        paths_set.update(ComputePythonDependencies())
       _ImportModuleByPath(module)
-      paths_set.update(ComputePythonDependencies())
+    paths_set.update(ComputePythonDependencies())
   except Exception:
     # Output extra diagnostics when loading the script fails.
     sys.stderr.write('Error running print_python_deps.py.\n')
@@ -164,22 +192,38 @@ def main():
     sys.stderr.write('python={}\n'.format(sys.executable))
     raise
 
-  for path in options.allowlists:
-    paths_set.update(
-        os.path.abspath(p)
-        for p in _FindPythonInDirectory(path, allow_test=False))
+  # Allowlisted directories are independent, so walk them in parallel.
+  def find_allowlisted(path):
+    return list(_FindPythonInDirectory(path, allow_test=False))
+
+  with concurrent.futures.ThreadPoolExecutor(
+      max_workers=min(8, len(options.allowlists) or 1)) as executor:
+    for found in executor.map(find_allowlisted, options.allowlists):
+      paths_set.update(os.path.abspath(p) for p in found)
+
+  # Many paths share a directory, so only compute relpath() once per directory.
+  rel_dirs = {}
+
+  def relpath(path):
+    dirname, basename = os.path.split(path)
+    rel_dir = rel_dirs.get(dirname)
+    if rel_dir is None:
+      rel_dir = rel_dirs[dirname] = os.path.relpath(dirname, options.root)
+    return basename if rel_dir == os.curdir else os.path.join(rel_dir, basename)
+
+  paths = [relpath(p) for p in paths_set]
 
-  paths = [os.path.relpath(p, options.root) for p in paths_set]
+  lines = []
+  if not options.no_header:
+    lines.append('# Generated by running:\n')
+    lines.append('#   %s\n' % _NormalizeCommandLine(options))
+  prefix = '//' if options.gn_paths else ''
+  lines.extend(prefix + path.replace('\\', '/') + '\n'
+               for path in sorted(paths))
 
-  normalized_cmdline = _NormalizeCommandLine(options)
   out = open(options.output, 'w', newline='') if options.output else sys.stdout
   with out:
-    if not options.no_header:
-      out.write('# Generated by running:\n')
-      out.write('#   %s\n' % normalized_cmdline)
-    prefix = '//' if options.gn_paths else ''
-    for path in sorted(paths):
-      out.write(prefix + path.replace('\\', '/') + '\n')
+    out.write(''.join(lines))
 
 
 if __name__ == '__main__':
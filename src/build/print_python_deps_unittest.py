@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# Copyright 2026 The Chromium Authors
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+import print_python_deps
+
+_BUILD_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _WriteFile(path, data=''):
+  os.makedirs(os.path.dirname(path), exist_ok=True)
+  with open(path, 'w') as f:
+    f.write(data)
+
+
+class PrintPythonDepsTest(unittest.TestCase):
+  def setUp(self):
+    # Dependencies are only reported for files within src/.
+    temp_dir = tempfile.TemporaryDirectory(dir=_BUILD_DIR)
+    self.addCleanup(temp_dir.cleanup)
+    self.temp_dir = temp_dir.name
+
+    # main() imports the modules it analyzes into this process.
+    for patcher in (mock.patch.dict(sys.modules),
+                    mock.patch.object(sys, 'path', list(sys.path)),
+                    mock.patch.object(sys, 'dont_write_bytecode', True)):
+      patcher.start()
+      self.addCleanup(patcher.stop)
+
+  def _AddModule(self, name, path):
+    module = types.ModuleType(name)
+    module.__file__ = path
+    sys.modules[name] = module
+
+  def _RunMain(self, module):
+    output = os.path.join(self.temp_dir, 'out.pydeps')
+    argv = [
+        'print_python_deps.py', '--no-header', '--root', self.temp_dir,
+        '--output', output, module
+    ]
+    with mock.patch.object(sys, 'argv', argv), \
+        mock.patch.object(sys, 'executable', 'vpython3'):
+      print_python_deps.main()
+    # Ignore the modules of the test itself, which are outside of temp_dir.
+    with open(output) as f:
+      return [p for p in f.read().splitlines() if not p.startswith(os.pardir)]
+
+  def testComputePythonDependenciesSkipsSystemModules(self):
+    path = os.path.join(self.temp_dir, 'foo.py')
+    self._AddModule('print_python_deps_unittest_foo', path)
+    self._AddModule('print_python_deps_unittest_system',
+                    os.path.join(os.sep, 'usr', 'lib', 'foo.py'))
+
+    deps = print_python_deps.ComputePythonDependencies()
+
+    self.assertIn(path, deps)
+    self.assertNotIn(os.path.join(os.sep, 'usr', 'lib', 'foo.py'), deps)
+    self.assertNotIn(os.path.abspath(print_python_deps.__file__), deps)
+
+  def testComputePythonDependenciesNormalizesPaths(self):
+    path = os.path.join(self.temp_dir, 'foo.py')
+    self._AddModule('print_python_deps_unittest_relative',
+                    os.path.relpath(path))
+    self._AddModule('print_python_deps_unittest_dotdot',
+                    os.path.join(self.temp_dir, 'bar', os.pardir, 'baz.py'))
+    self._AddModule('print_python_deps_unittest_pyc', path + 'c')
+
+    deps = print_python_deps.ComputePythonDependencies()
+
+    self.assertIn(path, deps)
+    self.assertIn(os.path.join(self.temp_dir, 'baz.py'), deps)
+    self.assertNotIn(path + 'c', deps)
+
+  def testModule(self):
+    _WriteFile(os.path.join(self.temp_dir, 'main.py'), 'import helper\n')
+    _WriteFile(os.path.join(self.temp_dir, 'helper.py'))
+
+    deps = self._RunMain(os.path.join(self.temp_dir, 'main.py'))
+
+    self.assertEqual(deps, ['helper.py', 'main.py'])
+
+  def testDirectoryWithModulesOfTheSameName(self):
+    # Both foo.py files are imported as "foo", so the second one replaces the
+    # first in sys.modules.
+    _WriteFile(os.path.join(self.temp_dir, 'a', 'foo.py'), 'import helper_a\n')
+    _WriteFile(os.path.join(self.temp_dir, 'a', 'helper_a.py'))
+    _WriteFile(os.path.join(self.temp_dir, 'b', 'foo.py'), 'import helper_b\n')
+    _WriteFile(os.path.join(self.temp_dir, 'b', 'helper_b.py'))
+
+    deps = self._RunMain(self.temp_dir)
+
+    self.assertEqual(deps, [
+        os.path.join('a', 'foo.py'),
+        os.path.join('a', 'helper_a.py'),
+        os.path.join('b', 'foo.py'),
+        os.path.join('b', 'helper_b.py'),
+    ])
+
+  def testFindPythonInMissingDirectory(self):
+    missing_dir = os.path.join(self.temp_dir, 'missing')
+
+    self.assertEqual(
+        list(print_python_deps._FindPythonInDirectory(missing_dir, True)), [])
+
+
+if __name__ == '__main__':
+  unittest.main()
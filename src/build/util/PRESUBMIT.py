@@ -22,7 +22,10 @@ def _GetFilesToSkip(input_api):
   android_chrome_version_script_change = next(
       (f for f in affected_files if re.search(
           '\\/android_chrome_version\\.py$|'
-          '\\/android_chrome_version_test\\.py$', f.LocalPath())), None)
+          '\\/android_chrome_version_tables\\.py$|'
+          '\\/android_chrome_version_test\\.py$|'
+          '\\/generate_android_chrome_version_tables\\.py$', f.LocalPath())),
+      None)
 
   if android_chrome_version_script_change is None:
     files_to_skip.append('android_chrome_version_test\\.py$')
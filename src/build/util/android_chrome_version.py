@@ -45,21 +45,19 @@ For example:
 
 """
 
-import argparse
-from collections import namedtuple
-
-# Package name version bits.
-_PACKAGE_NAMES = {
-    'CHROME': 0,
-    'CHROME_MODERN': 10,
-    'MONOCHROME': 20,
-    'TRICHROME': 30,
-    'TRICHROME_BETA': 40,
-    'TRICHROME_AUTO': 50,
-    'WEBVIEW_STABLE': 0,
-    'WEBVIEW_BETA': 10,
-    'WEBVIEW_DEV': 20,
-}
+import enum
+import functools
+import types
+import typing
+
+# Lookup tables generated by generate_android_chrome_version_tables.py, which
+# also holds the tables they are derived from.
+from android_chrome_version_tables import _ABI_DIGIT_TO_NAME
+from android_chrome_version_tables import _ABI_DIGIT_TO_NAME_OLD
+from android_chrome_version_tables import _PACKAGE_DIGIT_TO_NAME
+from android_chrome_version_tables import _VERSION_CODE_OFFSETS
+
+
 """ "Next" builds get +500 on their patch number.
 
 This ensures that they are considered "newer" than any non-next build of the
@@ -69,187 +67,38 @@ actual patch number will never reach 500, which has never even come close in
 the past.
 """
 _NEXT_BUILD_VERSION_CODE_DIFF = 50000
-"""List of version numbers to be created for each build configuration.
-Tuple format:
 
-  (version code name), (package name), (supported ABIs)
 
-Here, (supported ABIs) is referring to the combination of browser ABI and
-webview library ABI present in a particular APK. For example, 64_32 implies a
-64-bit browser with an extra 32-bit Webview library. See also
-_ABIS_TO_DIGIT_MASK.
-"""
-_APKS = {
-    '32': [
-        ('CHROME', 'CHROME', '32'),
-        ('CHROME_MODERN', 'CHROME_MODERN', '32'),
-        ('MONOCHROME', 'MONOCHROME', '32'),
-        ('TRICHROME', 'TRICHROME', '32'),
-        ('TRICHROME_AUTO', 'TRICHROME_AUTO', '32'),
-        ('TRICHROME_BETA', 'TRICHROME_BETA', '32'),
-        ('WEBVIEW_STABLE', 'WEBVIEW_STABLE', '32'),
-        ('WEBVIEW_BETA', 'WEBVIEW_BETA', '32'),
-        ('WEBVIEW_DEV', 'WEBVIEW_DEV', '32'),
-    ],
-    '64': [
-        ('CHROME', 'CHROME', '64'),
-        ('CHROME_MODERN', 'CHROME_MODERN', '64'),
-        ('MONOCHROME', 'MONOCHROME', '64'),
-        ('TRICHROME', 'TRICHROME', '64'),
-        ('TRICHROME_AUTO', 'TRICHROME_AUTO', '64'),
-        ('TRICHROME_BETA', 'TRICHROME_BETA', '64'),
-        ('WEBVIEW_STABLE', 'WEBVIEW_STABLE', '64'),
-        ('WEBVIEW_BETA', 'WEBVIEW_BETA', '64'),
-        ('WEBVIEW_DEV', 'WEBVIEW_DEV', '64'),
-    ],
-    'hybrid': [
-        ('CHROME', 'CHROME', '64'),
-        ('CHROME_32', 'CHROME', '32'),
-        ('CHROME_MODERN', 'CHROME_MODERN', '64'),
-        ('MONOCHROME', 'MONOCHROME', '32_64'),
-        ('MONOCHROME_32', 'MONOCHROME', '32'),
-        ('MONOCHROME_32_64', 'MONOCHROME', '32_64'),
-        ('MONOCHROME_64_32', 'MONOCHROME', '64_32'),
-        ('MONOCHROME_64', 'MONOCHROME', '64'),
-        ('TRICHROME', 'TRICHROME', '32_64'),
-        ('TRICHROME_32', 'TRICHROME', '32'),
-        ('TRICHROME_32_64', 'TRICHROME', '32_64'),
-        ('TRICHROME_64_32', 'TRICHROME', '64_32'),
-        ('TRICHROME_64_32_HIGH', 'TRICHROME', '64_32_high'),
-        ('TRICHROME_64', 'TRICHROME', '64'),
-        ('TRICHROME_AUTO', 'TRICHROME_AUTO', '32_64'),
-        ('TRICHROME_AUTO_32', 'TRICHROME_AUTO', '32'),
-        ('TRICHROME_AUTO_32_64', 'TRICHROME_AUTO', '32_64'),
-        ('TRICHROME_AUTO_64', 'TRICHROME_AUTO', '64'),
-        ('TRICHROME_AUTO_64_32', 'TRICHROME_AUTO', '64_32'),
-        ('TRICHROME_AUTO_64_32_HIGH', 'TRICHROME_AUTO', '64_32_high'),
-        ('TRICHROME_BETA', 'TRICHROME_BETA', '32_64'),
-        ('TRICHROME_32_BETA', 'TRICHROME_BETA', '32'),
-        ('TRICHROME_32_64_BETA', 'TRICHROME_BETA', '32_64'),
-        ('TRICHROME_64_32_BETA', 'TRICHROME_BETA', '64_32'),
-        ('TRICHROME_64_32_HIGH_BETA', 'TRICHROME_BETA', '64_32_high'),
-        ('TRICHROME_64_BETA', 'TRICHROME_BETA', '64'),
-        ('WEBVIEW_STABLE', 'WEBVIEW_STABLE', '32_64'),
-        ('WEBVIEW_BETA', 'WEBVIEW_BETA', '32_64'),
-        ('WEBVIEW_DEV', 'WEBVIEW_DEV', '32_64'),
-        ('WEBVIEW_32_STABLE', 'WEBVIEW_STABLE', '32'),
-        ('WEBVIEW_32_BETA', 'WEBVIEW_BETA', '32'),
-        ('WEBVIEW_32_DEV', 'WEBVIEW_DEV', '32'),
-        ('WEBVIEW_64_STABLE', 'WEBVIEW_STABLE', '64'),
-        ('WEBVIEW_64_BETA', 'WEBVIEW_BETA', '64'),
-        ('WEBVIEW_64_DEV', 'WEBVIEW_DEV', '64'),
-    ]
-}
-
-# Splits input build config architecture to manufacturer and bitness.
-_ARCH_TO_MFG_AND_BITNESS = {
-    'arm': ('arm', '32'),
-    'arm64': ('arm', 'hybrid'),
-    # Until riscv64 needs a unique version code to ship APKs to the store,
-    # point to the 'arm' bitmask.
-    'riscv64': ('arm', '64'),
-    'x86': ('intel', '32'),
-    'x64': ('intel', 'hybrid'),
-}
+class Arch(enum.IntEnum):
+  """Build config architectures. Names match target_cpu, uppercased.
 
-# Expose the available choices to other scripts.
-ARCH_CHOICES = _ARCH_TO_MFG_AND_BITNESS.keys()
-"""
-The architecture preference is encoded into the version_code for devices
-that support multiple architectures. (exploiting play store logic that pushes
-apk with highest version code)
-
-Detail:
-Many Android devices support multiple architectures, and can run applications
-built for any of them; the Play Store considers all of the supported
-architectures compatible and does not, itself, have any preference for which
-is "better". The common cases here:
-
-- All production arm64 devices can also run arm
-- All production x64 devices can also run x86
-- Pretty much all production x86/x64 devices can also run arm (via a binary
-  translator)
-
-Since the Play Store has no particular preferences, you have to encode your own
-preferences into the ordering of the version codes. There's a few relevant
-things here:
-
-- For any android app, it's theoretically preferable to ship a 64-bit version to
-  64-bit devices if it exists, because the 64-bit architectures are supposed to
-  be "better" than their 32-bit predecessors (unfortunately this is not always
-  true due to the effect on memory usage, but we currently deal with this by
-  simply not shipping a 64-bit version *at all* on the configurations where we
-  want the 32-bit version to be used).
-- For any android app, it's definitely preferable to ship an x86 version to x86
-  devices if it exists instead of an arm version, because running things through
-  the binary translator is a performance hit.
-- For WebView, Monochrome, and Trichrome specifically, they are a special class
-  of APK called "multiarch" which means that they actually need to *use* more
-  than one architecture at runtime (rather than simply being compatible with
-  more than one). The 64-bit builds of these multiarch APKs contain both 32-bit
-  and 64-bit code, so that Webview is available for both ABIs. If you're
-  multiarch you *must* have a version that supports both 32-bit and 64-bit
-  version on a 64-bit device, otherwise it won't work properly. So, the 64-bit
-  version needs to be a higher versionCode, as otherwise a 64-bit device would
-  prefer the 32-bit version that does not include any 64-bit code, and fail.
-"""
+  Values index the generated version code tables.
+  """
+  ARM = 0
+  ARM64 = 1
+  RISCV64 = 2
+  X86 = 3
+  X64 = 4
 
 
-def _GetAbisToDigitMask(build_number, patch_number):
-  """Return the correct digit mask based on build number.
+_ARCH_BY_NAME = {arch.name.lower(): arch for arch in Arch}
 
-  Updated from build 5750: Some intel devices advertise support for arm,
-  so arm codes must be lower than x86 codes to prevent providing an
-  arm-optimized build to intel devices.
+# Expose the available choices to other scripts.
+ARCH_CHOICES = _ARCH_BY_NAME.keys()
 
-  Returns:
-    A dictionary of architecture mapped to bitness
-    mapped to version code suffix.
-  """
+
+def _UsesNewAbiScheme(build_number, patch_number):
   # Scheme change was made directly to M113 and M114 branches.
-  use_new_scheme = (build_number >= 5750
-                    or (build_number == 5672 and patch_number >= 176)
-                    or (build_number == 5735 and patch_number >= 53))
-  if use_new_scheme:
-    return {
-        'arm': {
-            '32': 0,
-            '32_64': 1,
-            '64_32': 2,
-            '64_32_high': 3,
-            '64': 4,
-        },
-        'intel': {
-            '32': 6,
-            '32_64': 7,
-            '64_32': 8,
-            '64': 9,
-        },
-    }
-  return {
-      'arm': {
-          '32': 0,
-          '32_64': 3,
-          '64_32': 4,
-          '64': 5,
-          '64_32_high': 9,
-      },
-      'intel': {
-          '32': 1,
-          '32_64': 6,
-          '64_32': 7,
-          '64': 8,
-      },
-  }
+  return (build_number >= 5750 or (build_number == 5672 and patch_number >= 176)
+          or (build_number == 5735 and patch_number >= 53))
 
 
-VersionCodeComponents = namedtuple('VersionCodeComponents', [
-    'build_number',
-    'patch_number',
-    'package_name',
-    'abi',
-    'is_next_build',
-])
+class VersionCodeComponents(typing.NamedTuple):
+  build_number: int
+  patch_number: int
+  package_name: str
+  abi: str
+  is_next_build: bool
 
 
 def TranslateVersionCode(version_code, is_webview=False):
@@ -268,58 +117,47 @@ def TranslateVersionCode(version_code, is_webview=False):
     build, you should get:
       5678, 99, 'MONOCHROME', 'arm_64_32', False
   """
-  if len(version_code) == 9:
-    build_number = int(version_code[:4])
-  else:
-    # At one branch per day, we'll hit 5 digits in the year 2035.
-    build_number = int(version_code[:5])
-
-  is_next_build = False
-  patch_number_plus_extra = int(version_code[-5:])
-  if patch_number_plus_extra >= _NEXT_BUILD_VERSION_CODE_DIFF:
-    is_next_build = True
-    patch_number_plus_extra -= _NEXT_BUILD_VERSION_CODE_DIFF
+  # The last 5 digits are the patch number plus the next-build offset and the
+  # package and abi digits; the rest is the build number, which at one branch
+  # per day hits 5 digits in the year 2035.
+  version_code_value = int(version_code)
+  build_number, patch_number_plus_extra = divmod(version_code_value, 100000)
+
+  is_next_build = patch_number_plus_extra >= _NEXT_BUILD_VERSION_CODE_DIFF
+  patch_number_plus_extra -= is_next_build * _NEXT_BUILD_VERSION_CODE_DIFF
   patch_number = patch_number_plus_extra // 100
 
   # From branch 3992 the name and abi bits in the version code are swapped.
+  low_digits, last_digit = divmod(version_code_value % 100, 10)
   if build_number >= 3992:
-    abi_digit = int(version_code[-1])
-    package_digit = int(version_code[-2])
+    abi_digit = last_digit
+    package_digit = low_digits
   else:
-    abi_digit = int(version_code[-2])
-    package_digit = int(version_code[-1])
+    abi_digit = low_digits
+    package_digit = last_digit
 
   # Before branch 4844 we added 5 to the package digit to indicate a 'next'
   # build.
-  if build_number < 4844 and package_digit >= 5:
-    is_next_build = True
-    package_digit -= 5
-
-  for package, number in _PACKAGE_NAMES.items():
-    if number == package_digit * 10:
-      if is_webview == ('WEBVIEW' in package):
-        package_name = package
-        break
-
-  for arch, bitness_to_number in (_GetAbisToDigitMask(build_number,
-                                                      patch_number).items()):
-    for bitness, number in bitness_to_number.items():
-      if abi_digit == number:
-        abi = arch if arch != 'intel' else 'x86'
-        if bitness != '32':
-          abi += '_' + bitness
-        break
+  old_next_build = (build_number < 4844) & (package_digit >= 5)
+  is_next_build |= old_next_build
+  package_digit -= old_next_build * 5
+
+  package_name = _PACKAGE_DIGIT_TO_NAME[(package_digit, is_webview)]
+  if _UsesNewAbiScheme(build_number, patch_number):
+    abi = _ABI_DIGIT_TO_NAME[abi_digit]
+  else:
+    abi = _ABI_DIGIT_TO_NAME_OLD[abi_digit]
 
   return VersionCodeComponents(build_number, patch_number, package_name, abi,
                                is_next_build)
 
 
 def GenerateVersionCodes(build_number, patch_number, arch, is_next_build):
-  """Build dict of version codes for the specified build architecture. Eg:
+  """Build mapping of version codes for the specified build architecture. Eg:
 
   {
-    'CHROME_VERSION_CODE': '378100010',
-    'MONOCHROME_VERSION_CODE': '378100013',
+    'CHROME_VERSION_CODE': 378100010,
+    'MONOCHROME_VERSION_CODE': 378100013,
     ...
   }
 
@@ -336,31 +174,48 @@ def GenerateVersionCodes(build_number, patch_number, arch, is_next_build):
     maintained by the humans who set MAJOR.
 
   Thus, this method is responsible for the final two digits of versionCode.
+
+  |arch| may be given either as an Arch or as one of ARCH_CHOICES.
+
+  Results are cached, so the returned mapping is shared and read-only. Copy it
+  with dict() to modify it.
   """
+  if not isinstance(arch, Arch):
+    arch = _ARCH_BY_NAME[arch]
+
+  return _GenerateVersionCodes(build_number, patch_number, arch,
+                               bool(is_next_build))
+
+
+@functools.lru_cache(maxsize=128)
+def _GenerateVersionCodes(build_number, patch_number, arch, is_next_build):
+  """Cached GenerateVersionCodes() result."""
   base_version_code = (build_number * 1000 + patch_number) * 100
 
   if is_next_build:
     base_version_code += _NEXT_BUILD_VERSION_CODE_DIFF
 
-  mfg, bitness = _ARCH_TO_MFG_AND_BITNESS[arch]
-
-  version_codes = {}
-
-  abi_to_digit_mask = _GetAbisToDigitMask(build_number, patch_number)
-  for apk, package, abis in _APKS[bitness]:
-    if abis == '64_32_high' and arch != 'arm64':
-      continue
-    abi_part = abi_to_digit_mask[mfg][abis]
-    package_part = _PACKAGE_NAMES[package]
+  return types.MappingProxyType({
+      version_code_name: base_version_code + offset
+      for version_code_name, offset in _VERSION_CODE_OFFSETS[
+          (arch, _UsesNewAbiScheme(build_number, patch_number))]
+  })
 
-    version_code_name = apk + '_VERSION_CODE'
-    version_code_val = base_version_code + package_part + abi_part
-    version_codes[version_code_name] = str(version_code_val)
 
-  return version_codes
+def GenerateVersionCodeStrings(build_number, patch_number, arch,
+                               is_next_build):
+  """Same as GenerateVersionCodes(), but with the version codes as strings."""
+  return {
+      k: str(v)
+      for k, v in GenerateVersionCodes(build_number, patch_number, arch,
+                                       is_next_build).items()
+  }
 
 
 def main():
+  # Imported here since most users only import this module for its functions.
+  import argparse
+
   parser = argparse.ArgumentParser(description='Parses version codes.')
   g1 = parser.add_argument_group('To Generate Version Name')
   g1.add_argument('--version-code', help='Version code (e.g. 529700010).')
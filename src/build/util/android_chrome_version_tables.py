@@ -0,0 +1,253 @@
+# Copyright 2026 The Chromium Authors
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# Generated by generate_android_chrome_version_tables.py. DO NOT EDIT.
+"""Lookup tables for android_chrome_version.py."""
+
+_ABI_DIGIT_TO_NAME = {
+    0: 'arm',
+    1: 'arm_32_64',
+    2: 'arm_64_32',
+    3: 'arm_64_32_high',
+    4: 'arm_64',
+    6: 'x86',
+    7: 'x86_32_64',
+    8: 'x86_64_32',
+    9: 'x86_64',
+}
+
+_ABI_DIGIT_TO_NAME_OLD = {
+    0: 'arm',
+    3: 'arm_32_64',
+    4: 'arm_64_32',
+    5: 'arm_64',
+    9: 'arm_64_32_high',
+    1: 'x86',
+    6: 'x86_32_64',
+    7: 'x86_64_32',
+    8: 'x86_64',
+}
+
+_PACKAGE_DIGIT_TO_NAME = {
+    (0, False): 'CHROME',
+    (1, False): 'CHROME_MODERN',
+    (2, False): 'MONOCHROME',
+    (3, False): 'TRICHROME',
+    (4, False): 'TRICHROME_BETA',
+    (5, False): 'TRICHROME_AUTO',
+    (0, True): 'WEBVIEW_STABLE',
+    (1, True): 'WEBVIEW_BETA',
+    (2, True): 'WEBVIEW_DEV',
+}
+
+_VERSION_CODE_OFFSETS = {
+    (0, False): (
+        ('CHROME_VERSION_CODE', 0),
+        ('CHROME_MODERN_VERSION_CODE', 10),
+        ('MONOCHROME_VERSION_CODE', 20),
+        ('TRICHROME_VERSION_CODE', 30),
+        ('TRICHROME_AUTO_VERSION_CODE', 50),
+        ('TRICHROME_BETA_VERSION_CODE', 40),
+        ('WEBVIEW_STABLE_VERSION_CODE', 0),
+        ('WEBVIEW_BETA_VERSION_CODE', 10),
+        ('WEBVIEW_DEV_VERSION_CODE', 20),
+    ),
+    (0, True): (
+        ('CHROME_VERSION_CODE', 0),
+        ('CHROME_MODERN_VERSION_CODE', 10),
+        ('MONOCHROME_VERSION_CODE', 20),
+        ('TRICHROME_VERSION_CODE', 30),
+        ('TRICHROME_AUTO_VERSION_CODE', 50),
+        ('TRICHROME_BETA_VERSION_CODE', 40),
+        ('WEBVIEW_STABLE_VERSION_CODE', 0),
+        ('WEBVIEW_BETA_VERSION_CODE', 10),
+        ('WEBVIEW_DEV_VERSION_CODE', 20),
+    ),
+    (1, False): (
+        ('CHROME_VERSION_CODE', 5),
+        ('CHROME_32_VERSION_CODE', 0),
+        ('CHROME_MODERN_VERSION_CODE', 15),
+        ('MONOCHROME_VERSION_CODE', 23),
+        ('MONOCHROME_32_VERSION_CODE', 20),
+        ('MONOCHROME_32_64_VERSION_CODE', 23),
+        ('MONOCHROME_64_32_VERSION_CODE', 24),
+        ('MONOCHROME_64_VERSION_CODE', 25),
+        ('TRICHROME_VERSION_CODE', 33),
+        ('TRICHROME_32_VERSION_CODE', 30),
+        ('TRICHROME_32_64_VERSION_CODE', 33),
+        ('TRICHROME_64_32_VERSION_CODE', 34),
+        ('TRICHROME_64_32_HIGH_VERSION_CODE', 39),
+        ('TRICHROME_64_VERSION_CODE', 35),
+        ('TRICHROME_AUTO_VERSION_CODE', 53),
+        ('TRICHROME_AUTO_32_VERSION_CODE', 50),
+        ('TRICHROME_AUTO_32_64_VERSION_CODE', 53),
+        ('TRICHROME_AUTO_64_VERSION_CODE', 55),
+        ('TRICHROME_AUTO_64_32_VERSION_CODE', 54),
+        ('TRICHROME_AUTO_64_32_HIGH_VERSION_CODE', 59),
+        ('TRICHROME_BETA_VERSION_CODE', 43),
+        ('TRICHROME_32_BETA_VERSION_CODE', 40),
+        ('TRICHROME_32_64_BETA_VERSION_CODE', 43),
+        ('TRICHROME_64_32_BETA_VERSION_CODE', 44),
+        ('TRICHROME_64_32_HIGH_BETA_VERSION_CODE', 49),
+        ('TRICHROME_64_BETA_VERSION_CODE', 45),
+        ('WEBVIEW_STABLE_VERSION_CODE', 3),
+        ('WEBVIEW_BETA_VERSION_CODE', 13),
+        ('WEBVIEW_DEV_VERSION_CODE', 23),
+        ('WEBVIEW_32_STABLE_VERSION_CODE', 0),
+        ('WEBVIEW_32_BETA_VERSION_CODE', 10),
+        ('WEBVIEW_32_DEV_VERSION_CODE', 20),
+        ('WEBVIEW_64_STABLE_VERSION_CODE', 5),
+        ('WEBVIEW_64_BETA_VERSION_CODE', 15),
+        ('WEBVIEW_64_DEV_VERSION_CODE', 25),
+    ),
+    (1, True): (
+        ('CHROME_VERSION_CODE', 4),
+        ('CHROME_32_VERSION_CODE', 0),
+        ('CHROME_MODERN_VERSION_CODE', 14),
+        ('MONOCHROME_VERSION_CODE', 21),
+        ('MONOCHROME_32_VERSION_CODE', 20),
+        ('MONOCHROME_32_64_VERSION_CODE', 21),
+        ('MONOCHROME_64_32_VERSION_CODE', 22),
+        ('MONOCHROME_64_VERSION_CODE', 24),
+        ('TRICHROME_VERSION_CODE', 31),
+        ('TRICHROME_32_VERSION_CODE', 30),
+        ('TRICHROME_32_64_VERSION_CODE', 31),
+        ('TRICHROME_64_32_VERSION_CODE', 32),
+        ('TRICHROME_64_32_HIGH_VERSION_CODE', 33),
+        ('TRICHROME_64_VERSION_CODE', 34),
+        ('TRICHROME_AUTO_VERSION_CODE', 51),
+        ('TRICHROME_AUTO_32_VERSION_CODE', 50),
+        ('TRICHROME_AUTO_32_64_VERSION_CODE', 51),
+        ('TRICHROME_AUTO_64_VERSION_CODE', 54),
+        ('TRICHROME_AUTO_64_32_VERSION_CODE', 52),
+        ('TRICHROME_AUTO_64_32_HIGH_VERSION_CODE', 53),
+        ('TRICHROME_BETA_VERSION_CODE', 41),
+        ('TRICHROME_32_BETA_VERSION_CODE', 40),
+        ('TRICHROME_32_64_BETA_VERSION_CODE', 41),
+        ('TRICHROME_64_32_BETA_VERSION_CODE', 42),
+        ('TRICHROME_64_32_HIGH_BETA_VERSION_CODE', 43),
+        ('TRICHROME_64_BETA_VERSION_CODE', 44),
+        ('WEBVIEW_STABLE_VERSION_CODE', 1),
+        ('WEBVIEW_BETA_VERSION_CODE', 11),
+        ('WEBVIEW_DEV_VERSION_CODE', 21),
+        ('WEBVIEW_32_STABLE_VERSION_CODE', 0),
+        ('WEBVIEW_32_BETA_VERSION_CODE', 10),
+        ('WEBVIEW_32_DEV_VERSION_CODE', 20),
+        ('WEBVIEW_64_STABLE_VERSION_CODE', 4),
+        ('WEBVIEW_64_BETA_VERSION_CODE', 14),
+        ('WEBVIEW_64_DEV_VERSION_CODE', 24),
+    ),
+    (2, False): (
+        ('CHROME_VERSION_CODE', 5),
+        ('CHROME_MODERN_VERSION_CODE', 15),
+        ('MONOCHROME_VERSION_CODE', 25),
+        ('TRICHROME_VERSION_CODE', 35),
+        ('TRICHROME_AUTO_VERSION_CODE', 55),
+        ('TRICHROME_BETA_VERSION_CODE', 45),
+        ('WEBVIEW_STABLE_VERSION_CODE', 5),
+        ('WEBVIEW_BETA_VERSION_CODE', 15),
+        ('WEBVIEW_DEV_VERSION_CODE', 25),
+    ),
+    (2, True): (
+        ('CHROME_VERSION_CODE', 4),
+        ('CHROME_MODERN_VERSION_CODE', 14),
+        ('MONOCHROME_VERSION_CODE', 24),
+        ('TRICHROME_VERSION_CODE', 34),
+        ('TRICHROME_AUTO_VERSION_CODE', 54),
+        ('TRICHROME_BETA_VERSION_CODE', 44),
+        ('WEBVIEW_STABLE_VERSION_CODE', 4),
+        ('WEBVIEW_BETA_VERSION_CODE', 14),
+        ('WEBVIEW_DEV_VERSION_CODE', 24),
+    ),
+    (3, False): (
+        ('CHROME_VERSION_CODE', 1),
+        ('CHROME_MODERN_VERSION_CODE', 11),
+        ('MONOCHROME_VERSION_CODE', 21),
+        ('TRICHROME_VERSION_CODE', 31),
+        ('TRICHROME_AUTO_VERSION_CODE', 51),
+        ('TRICHROME_BETA_VERSION_CODE', 41),
+        ('WEBVIEW_STABLE_VERSION_CODE', 1),
+        ('WEBVIEW_BETA_VERSION_CODE', 11),
+        ('WEBVIEW_DEV_VERSION_CODE', 21),
+    ),
+    (3, True): (
+        ('CHROME_VERSION_CODE', 6),
+        ('CHROME_MODERN_VERSION_CODE', 16),
+        ('MONOCHROME_VERSION_CODE', 26),
+        ('TRICHROME_VERSION_CODE', 36),
+        ('TRICHROME_AUTO_VERSION_CODE', 56),
+        ('TRICHROME_BETA_VERSION_CODE', 46),
+        ('WEBVIEW_STABLE_VERSION_CODE', 6),
+        ('WEBVIEW_BETA_VERSION_CODE', 16),
+        ('WEBVIEW_DEV_VERSION_CODE', 26),
+    ),
+    (4, False): (
+        ('CHROME_VERSION_CODE', 8),
+        ('CHROME_32_VERSION_CODE', 1),
+        ('CHROME_MODERN_VERSION_CODE', 18),
+        ('MONOCHROME_VERSION_CODE', 26),
+        ('MONOCHROME_32_VERSION_CODE', 21),
+        ('MONOCHROME_32_64_VERSION_CODE', 26),
+        ('MONOCHROME_64_32_VERSION_CODE', 27),
+        ('MONOCHROME_64_VERSION_CODE', 28),
+        ('TRICHROME_VERSION_CODE', 36),
+        ('TRICHROME_32_VERSION_CODE', 31),
+        ('TRICHROME_32_64_VERSION_CODE', 36),
+        ('TRICHROME_64_32_VERSION_CODE', 37),
+        ('TRICHROME_64_VERSION_CODE', 38),
+        ('TRICHROME_AUTO_VERSION_CODE', 56),
+        ('TRICHROME_AUTO_32_VERSION_CODE', 51),
+        ('TRICHROME_AUTO_32_64_VERSION_CODE', 56),
+        ('TRICHROME_AUTO_64_VERSION_CODE', 58),
+        ('TRICHROME_AUTO_64_32_VERSION_CODE', 57),
+        ('TRICHROME_BETA_VERSION_CODE', 46),
+        ('TRICHROME_32_BETA_VERSION_CODE', 41),
+        ('TRICHROME_32_64_BETA_VERSION_CODE', 46),
+        ('TRICHROME_64_32_BETA_VERSION_CODE', 47),
+        ('TRICHROME_64_BETA_VERSION_CODE', 48),
+        ('WEBVIEW_STABLE_VERSION_CODE', 6),
+        ('WEBVIEW_BETA_VERSION_CODE', 16),
+        ('WEBVIEW_DEV_VERSION_CODE', 26),
+        ('WEBVIEW_32_STABLE_VERSION_CODE', 1),
+        ('WEBVIEW_32_BETA_VERSION_CODE', 11),
+        ('WEBVIEW_32_DEV_VERSION_CODE', 21),
+        ('WEBVIEW_64_STABLE_VERSION_CODE', 8),
+        ('WEBVIEW_64_BETA_VERSION_CODE', 18),
+        ('WEBVIEW_64_DEV_VERSION_CODE', 28),
+    ),
+    (4, True): (
+        ('CHROME_VERSION_CODE', 9),
+        ('CHROME_32_VERSION_CODE', 6),
+        ('CHROME_MODERN_VERSION_CODE', 19),
+        ('MONOCHROME_VERSION_CODE', 27),
+        ('MONOCHROME_32_VERSION_CODE', 26),
+        ('MONOCHROME_32_64_VERSION_CODE', 27),
+        ('MONOCHROME_64_32_VERSION_CODE', 28),
+        ('MONOCHROME_64_VERSION_CODE', 29),
+        ('TRICHROME_VERSION_CODE', 37),
+        ('TRICHROME_32_VERSION_CODE', 36),
+        ('TRICHROME_32_64_VERSION_CODE', 37),
+        ('TRICHROME_64_32_VERSION_CODE', 38),
+        ('TRICHROME_64_VERSION_CODE', 39),
+        ('TRICHROME_AUTO_VERSION_CODE', 57),
+        ('TRICHROME_AUTO_32_VERSION_CODE', 56),
+        ('TRICHROME_AUTO_32_64_VERSION_CODE', 57),
+        ('TRICHROME_AUTO_64_VERSION_CODE', 59),
+        ('TRICHROME_AUTO_64_32_VERSION_CODE', 58),
+        ('TRICHROME_BETA_VERSION_CODE', 47),
+        ('TRICHROME_32_BETA_VERSION_CODE', 46),
+        ('TRICHROME_32_64_BETA_VERSION_CODE', 47),
+        ('TRICHROME_64_32_BETA_VERSION_CODE', 48),
+        ('TRICHROME_64_BETA_VERSION_CODE', 49),
+        ('WEBVIEW_STABLE_VERSION_CODE', 7),
+        ('WEBVIEW_BETA_VERSION_CODE', 17),
+        ('WEBVIEW_DEV_VERSION_CODE', 27),
+        ('WEBVIEW_32_STABLE_VERSION_CODE', 6),
+        ('WEBVIEW_32_BETA_VERSION_CODE', 16),
+        ('WEBVIEW_32_DEV_VERSION_CODE', 26),
+        ('WEBVIEW_64_STABLE_VERSION_CODE', 9),
+        ('WEBVIEW_64_BETA_VERSION_CODE', 19),
+        ('WEBVIEW_64_DEV_VERSION_CODE', 29),
+    ),
+}
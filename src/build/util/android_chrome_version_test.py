@@ -4,8 +4,12 @@
 
 import unittest
 
+from android_chrome_version import Arch
+from android_chrome_version import ARCH_CHOICES
 from android_chrome_version import GenerateVersionCodes
+from android_chrome_version import GenerateVersionCodeStrings
 from android_chrome_version import TranslateVersionCode
+import generate_android_chrome_version_tables
 
 
 class _VersionTest(unittest.TestCase):
@@ -20,7 +24,7 @@ class _VersionTest(unittest.TestCase):
 
     chrome_version_code = output['CHROME_VERSION_CODE']
 
-    self.assertEqual(chrome_version_code, '484400000')
+    self.assertEqual(chrome_version_code, 484400000)
 
   def testGenerateVersionCodesAndroidChromeModern(self):
     """Assert it gives correct values for standard/example inputs"""
@@ -30,7 +34,7 @@ class _VersionTest(unittest.TestCase):
 
     chrome_modern_version_code = output['CHROME_MODERN_VERSION_CODE']
 
-    self.assertEqual(chrome_modern_version_code, '484400010')
+    self.assertEqual(chrome_modern_version_code, 484400010)
 
   def testGenerateVersionCodesAndroidMonochrome(self):
     """Assert it gives correct values for standard/example inputs"""
@@ -40,7 +44,7 @@ class _VersionTest(unittest.TestCase):
 
     monochrome_version_code = output['MONOCHROME_VERSION_CODE']
 
-    self.assertEqual(monochrome_version_code, '484400020')
+    self.assertEqual(monochrome_version_code, 484400020)
 
   def testGenerateVersionCodesAndroidTrichrome(self):
     """Assert it gives correct values for standard/example inputs"""
@@ -51,8 +55,8 @@ class _VersionTest(unittest.TestCase):
     trichrome_version_code = output['TRICHROME_VERSION_CODE']
     trichrome_auto_version_code = output['TRICHROME_AUTO_VERSION_CODE']
 
-    self.assertEqual(trichrome_version_code, '484400030')
-    self.assertEqual(trichrome_auto_version_code, '484400050')
+    self.assertEqual(trichrome_version_code, 484400030)
+    self.assertEqual(trichrome_auto_version_code, 484400050)
 
   def testGenerateVersionCodesAndroidWebviewStable(self):
     """Assert it gives correct values for standard/example inputs"""
@@ -62,7 +66,7 @@ class _VersionTest(unittest.TestCase):
 
     webview_stable_version_code = output['WEBVIEW_STABLE_VERSION_CODE']
 
-    self.assertEqual(webview_stable_version_code, '484400000')
+    self.assertEqual(webview_stable_version_code, 484400000)
 
   def testGenerateVersionCodesAndroidWebviewBeta(self):
     """Assert it gives correct values for standard/example inputs"""
@@ -72,7 +76,7 @@ class _VersionTest(unittest.TestCase):
 
     webview_beta_version_code = output['WEBVIEW_BETA_VERSION_CODE']
 
-    self.assertEqual(webview_beta_version_code, '484400010')
+    self.assertEqual(webview_beta_version_code, 484400010)
 
   def testGenerateVersionCodesAndroidWebviewDev(self):
     """Assert it gives correct values for standard/example inputs"""
@@ -82,7 +86,7 @@ class _VersionTest(unittest.TestCase):
 
     webview_dev_version_code = output['WEBVIEW_DEV_VERSION_CODE']
 
-    self.assertEqual(webview_dev_version_code, '484400020')
+    self.assertEqual(webview_dev_version_code, 484400020)
 
   def testGenerateVersionCodesAndroidNextBuild(self):
     """Assert it handles "next" builds correctly"""
@@ -96,10 +100,10 @@ class _VersionTest(unittest.TestCase):
     webview_stable_version_code = output['WEBVIEW_STABLE_VERSION_CODE']
     webview_beta_version_code = output['WEBVIEW_BETA_VERSION_CODE']
 
-    self.assertEqual(chrome_version_code, '484450000')
-    self.assertEqual(monochrome_version_code, '484450020')
-    self.assertEqual(webview_stable_version_code, '484450000')
-    self.assertEqual(webview_beta_version_code, '484450010')
+    self.assertEqual(chrome_version_code, 484450000)
+    self.assertEqual(monochrome_version_code, 484450020)
+    self.assertEqual(webview_stable_version_code, 484450000)
+    self.assertEqual(webview_beta_version_code, 484450010)
 
   def testGenerateVersionCodesAndroidArchArm(self):
     """Assert it handles different architectures correctly.
@@ -114,7 +118,7 @@ class _VersionTest(unittest.TestCase):
                                   is_next_build=False)
     arch_chrome_version_code = output['CHROME_VERSION_CODE']
 
-    self.assertEqual(arch_chrome_version_code, '484400000')
+    self.assertEqual(arch_chrome_version_code, 484400000)
 
   def testGenerateVersionCodesAndroidArchX86(self):
     """Assert it handles different architectures correctly.
@@ -129,7 +133,7 @@ class _VersionTest(unittest.TestCase):
                                   is_next_build=False)
     arch_chrome_version_code = output['CHROME_VERSION_CODE']
 
-    self.assertEqual(arch_chrome_version_code, '484400001')
+    self.assertEqual(arch_chrome_version_code, 484400001)
 
   def testGenerateVersionCodesAndroidArchArm64(self):
     """Assert it handles different architectures correctly.
@@ -144,7 +148,7 @@ class _VersionTest(unittest.TestCase):
                                   is_next_build=False)
     arch_chrome_version_code = output['CHROME_VERSION_CODE']
 
-    self.assertEqual(arch_chrome_version_code, '484400005')
+    self.assertEqual(arch_chrome_version_code, 484400005)
 
   def testGenerateVersionCodesAndroidArchArm64Variants(self):
     """Assert it handles 64-bit-specific additional version codes correctly.
@@ -175,22 +179,22 @@ class _VersionTest(unittest.TestCase):
     arch_trichrome_auto_64_32_version_code = output[
         'TRICHROME_AUTO_64_32_VERSION_CODE']
 
-    self.assertEqual(arch_monochrome_32_version_code, '484400020')
-    self.assertEqual(arch_monochrome_32_64_version_code, '484400023')
-    self.assertEqual(arch_monochrome_version_code, '484400023')
-    self.assertEqual(arch_monochrome_64_32_version_code, '484400024')
-    self.assertEqual(arch_monochrome_64_version_code, '484400025')
-    self.assertEqual(arch_trichrome_32_version_code, '484400030')
-    self.assertEqual(arch_trichrome_32_64_version_code, '484400033')
-    self.assertEqual(arch_trichrome_version_code, '484400033')
-    self.assertEqual(arch_trichrome_64_32_version_code, '484400034')
-    self.assertEqual(arch_trichrome_64_32_high_version_code, '484400039')
-    self.assertEqual(arch_trichrome_64_version_code, '484400035')
-    self.assertEqual(arch_trichrome_auto_version_code, '484400053')
-    self.assertEqual(arch_trichrome_auto_32_version_code, '484400050')
-    self.assertEqual(arch_trichrome_auto_32_64_version_code, '484400053')
-    self.assertEqual(arch_trichrome_auto_64_version_code, '484400055')
-    self.assertEqual(arch_trichrome_auto_64_32_version_code, '484400054')
+    self.assertEqual(arch_monochrome_32_version_code, 484400020)
+    self.assertEqual(arch_monochrome_32_64_version_code, 484400023)
+    self.assertEqual(arch_monochrome_version_code, 484400023)
+    self.assertEqual(arch_monochrome_64_32_version_code, 484400024)
+    self.assertEqual(arch_monochrome_64_version_code, 484400025)
+    self.assertEqual(arch_trichrome_32_version_code, 484400030)
+    self.assertEqual(arch_trichrome_32_64_version_code, 484400033)
+    self.assertEqual(arch_trichrome_version_code, 484400033)
+    self.assertEqual(arch_trichrome_64_32_version_code, 484400034)
+    self.assertEqual(arch_trichrome_64_32_high_version_code, 484400039)
+    self.assertEqual(arch_trichrome_64_version_code, 484400035)
+    self.assertEqual(arch_trichrome_auto_version_code, 484400053)
+    self.assertEqual(arch_trichrome_auto_32_version_code, 484400050)
+    self.assertEqual(arch_trichrome_auto_32_64_version_code, 484400053)
+    self.assertEqual(arch_trichrome_auto_64_version_code, 484400055)
+    self.assertEqual(arch_trichrome_auto_64_32_version_code, 484400054)
 
   def testGenerateVersionCodesAndroidArchX64(self):
     """Assert it handles different architectures correctly.
@@ -205,7 +209,7 @@ class _VersionTest(unittest.TestCase):
                                   is_next_build=False)
     arch_chrome_version_code = output['CHROME_VERSION_CODE']
 
-    self.assertEqual(arch_chrome_version_code, '484400008')
+    self.assertEqual(arch_chrome_version_code, 484400008)
 
   def testGenerateVersionCodesAndroidArchX64Variants(self):
     """Assert it handles 64-bit-specific additional version codes correctly.
@@ -234,21 +238,21 @@ class _VersionTest(unittest.TestCase):
     arch_trichrome_auto_64_32_version_code = output[
         'TRICHROME_AUTO_64_32_VERSION_CODE']
 
-    self.assertEqual(arch_monochrome_32_version_code, '484400021')
-    self.assertEqual(arch_monochrome_32_64_version_code, '484400026')
-    self.assertEqual(arch_monochrome_version_code, '484400026')
-    self.assertEqual(arch_monochrome_64_32_version_code, '484400027')
-    self.assertEqual(arch_monochrome_64_version_code, '484400028')
-    self.assertEqual(arch_trichrome_32_version_code, '484400031')
-    self.assertEqual(arch_trichrome_32_64_version_code, '484400036')
-    self.assertEqual(arch_trichrome_version_code, '484400036')
-    self.assertEqual(arch_trichrome_64_32_version_code, '484400037')
-    self.assertEqual(arch_trichrome_64_version_code, '484400038')
-    self.assertEqual(arch_trichrome_auto_version_code, '484400056')
-    self.assertEqual(arch_trichrome_auto_32_version_code, '484400051')
-    self.assertEqual(arch_trichrome_auto_32_64_version_code, '484400056')
-    self.assertEqual(arch_trichrome_auto_64_version_code, '484400058')
-    self.assertEqual(arch_trichrome_auto_64_32_version_code, '484400057')
+    self.assertEqual(arch_monochrome_32_version_code, 484400021)
+    self.assertEqual(arch_monochrome_32_64_version_code, 484400026)
+    self.assertEqual(arch_monochrome_version_code, 484400026)
+    self.assertEqual(arch_monochrome_64_32_version_code, 484400027)
+    self.assertEqual(arch_monochrome_64_version_code, 484400028)
+    self.assertEqual(arch_trichrome_32_version_code, 484400031)
+    self.assertEqual(arch_trichrome_32_64_version_code, 484400036)
+    self.assertEqual(arch_trichrome_version_code, 484400036)
+    self.assertEqual(arch_trichrome_64_32_version_code, 484400037)
+    self.assertEqual(arch_trichrome_64_version_code, 484400038)
+    self.assertEqual(arch_trichrome_auto_version_code, 484400056)
+    self.assertEqual(arch_trichrome_auto_32_version_code, 484400051)
+    self.assertEqual(arch_trichrome_auto_32_64_version_code, 484400056)
+    self.assertEqual(arch_trichrome_auto_64_version_code, 484400058)
+    self.assertEqual(arch_trichrome_auto_64_32_version_code, 484400057)
 
   def testGenerateVersionCodesAndroidArchOrderArm(self):
     """Assert it handles different architectures correctly.
@@ -364,7 +368,7 @@ class _VersionGroupedTest(unittest.TestCase):
 
     chrome_version_code = output['CHROME_VERSION_CODE']
 
-    self.assertEqual(chrome_version_code, '575000000')
+    self.assertEqual(chrome_version_code, 575000000)
 
   def testGenerateVersionCodesAndroidChromeModern(self):
     """Assert it gives correct values for standard/example inputs"""
@@ -374,7 +378,7 @@ class _VersionGroupedTest(unittest.TestCase):
 
     chrome_modern_version_code = output['CHROME_MODERN_VERSION_CODE']
 
-    self.assertEqual(chrome_modern_version_code, '575000010')
+    self.assertEqual(chrome_modern_version_code, 575000010)
 
   def testGenerateVersionCodesAndroidMonochrome(self):
     """Assert it gives correct values for standard/example inputs"""
@@ -384,7 +388,7 @@ class _VersionGroupedTest(unittest.TestCase):
 
     monochrome_version_code = output['MONOCHROME_VERSION_CODE']
 
-    self.assertEqual(monochrome_version_code, '575000020')
+    self.assertEqual(monochrome_version_code, 575000020)
 
   def testGenerateVersionCodesAndroidTrichrome(self):
     """Assert it gives correct values for standard/example inputs"""
@@ -394,7 +398,7 @@ class _VersionGroupedTest(unittest.TestCase):
 
     trichrome_version_code = output['TRICHROME_VERSION_CODE']
 
-    self.assertEqual(trichrome_version_code, '575000030')
+    self.assertEqual(trichrome_version_code, 575000030)
 
   def testGenerateVersionCodesAndroidWebviewStable(self):
     """Assert it gives correct values for standard/example inputs"""
@@ -404,7 +408,7 @@ class _VersionGroupedTest(unittest.TestCase):
 
     webview_stable_version_code = output['WEBVIEW_STABLE_VERSION_CODE']
 
-    self.assertEqual(webview_stable_version_code, '575000000')
+    self.assertEqual(webview_stable_version_code, 575000000)
 
   def testGenerateVersionCodesAndroidWebviewBeta(self):
     """Assert it gives correct values for standard/example inputs"""
@@ -414,7 +418,7 @@ class _VersionGroupedTest(unittest.TestCase):
 
     webview_beta_version_code = output['WEBVIEW_BETA_VERSION_CODE']
 
-    self.assertEqual(webview_beta_version_code, '575000010')
+    self.assertEqual(webview_beta_version_code, 575000010)
 
   def testGenerateVersionCodesAndroidWebviewDev(self):
     """Assert it gives correct values for standard/example inputs"""
@@ -424,7 +428,7 @@ class _VersionGroupedTest(unittest.TestCase):
 
     webview_dev_version_code = output['WEBVIEW_DEV_VERSION_CODE']
 
-    self.assertEqual(webview_dev_version_code, '575000020')
+    self.assertEqual(webview_dev_version_code, 575000020)
 
   def testGenerateVersionCodesAndroidNextBuild(self):
     """Assert it handles "next" builds correctly"""
@@ -438,10 +442,10 @@ class _VersionGroupedTest(unittest.TestCase):
     webview_stable_version_code = output['WEBVIEW_STABLE_VERSION_CODE']
     webview_beta_version_code = output['WEBVIEW_BETA_VERSION_CODE']
 
-    self.assertEqual(chrome_version_code, '575050000')
-    self.assertEqual(monochrome_version_code, '575050020')
-    self.assertEqual(webview_stable_version_code, '575050000')
-    self.assertEqual(webview_beta_version_code, '575050010')
+    self.assertEqual(chrome_version_code, 575050000)
+    self.assertEqual(monochrome_version_code, 575050020)
+    self.assertEqual(webview_stable_version_code, 575050000)
+    self.assertEqual(webview_beta_version_code, 575050010)
 
   def testGenerateVersionCodesAndroidArchArm(self):
     """Assert it handles different architectures correctly.
@@ -456,7 +460,7 @@ class _VersionGroupedTest(unittest.TestCase):
                                   is_next_build=False)
     arch_chrome_version_code = output['CHROME_VERSION_CODE']
 
-    self.assertEqual(arch_chrome_version_code, '575000000')
+    self.assertEqual(arch_chrome_version_code, 575000000)
 
   def testGenerateVersionCodesAndroidArchX86(self):
     """Assert it handles different architectures correctly.
@@ -471,7 +475,7 @@ class _VersionGroupedTest(unittest.TestCase):
                                   is_next_build=False)
     arch_chrome_version_code = output['CHROME_VERSION_CODE']
 
-    self.assertEqual(arch_chrome_version_code, '575000006')
+    self.assertEqual(arch_chrome_version_code, 575000006)
 
   def testGenerateVersionCodesAndroidArchArm64(self):
     """Assert it handles different architectures correctly.
@@ -486,7 +490,7 @@ class _VersionGroupedTest(unittest.TestCase):
                                   is_next_build=False)
     arch_chrome_version_code = output['CHROME_VERSION_CODE']
 
-    self.assertEqual(arch_chrome_version_code, '575000004')
+    self.assertEqual(arch_chrome_version_code, 575000004)
 
   def testGenerateVersionCodesAndroidArchArm64Variants(self):
     """Assert it handles 64-bit-specific additional version codes correctly.
@@ -519,23 +523,23 @@ class _VersionGroupedTest(unittest.TestCase):
     arch_trichrome_auto_64_32_high_version_code = output[
         'TRICHROME_AUTO_64_32_HIGH_VERSION_CODE']
 
-    self.assertEqual(arch_monochrome_32_version_code, '575000020')
-    self.assertEqual(arch_monochrome_32_64_version_code, '575000021')
-    self.assertEqual(arch_monochrome_version_code, '575000021')
-    self.assertEqual(arch_monochrome_64_32_version_code, '575000022')
-    self.assertEqual(arch_monochrome_64_version_code, '575000024')
-    self.assertEqual(arch_trichrome_32_version_code, '575000030')
-    self.assertEqual(arch_trichrome_32_64_version_code, '575000031')
-    self.assertEqual(arch_trichrome_version_code, '575000031')
-    self.assertEqual(arch_trichrome_64_32_version_code, '575000032')
-    self.assertEqual(arch_trichrome_64_32_high_version_code, '575000033')
-    self.assertEqual(arch_trichrome_64_version_code, '575000034')
-    self.assertEqual(arch_trichrome_auto_64_32_version_code, '575000052')
-    self.assertEqual(arch_trichrome_auto_64_32_high_version_code, '575000053')
-    self.assertEqual(arch_trichrome_auto_64_version_code, '575000054')
-    self.assertEqual(arch_trichrome_auto_version_code, '575000051')
-    self.assertEqual(arch_trichrome_auto_32_version_code, '575000050')
-    self.assertEqual(arch_trichrome_auto_32_64_version_code, '575000051')
+    self.assertEqual(arch_monochrome_32_version_code, 575000020)
+    self.assertEqual(arch_monochrome_32_64_version_code, 575000021)
+    self.assertEqual(arch_monochrome_version_code, 575000021)
+    self.assertEqual(arch_monochrome_64_32_version_code, 575000022)
+    self.assertEqual(arch_monochrome_64_version_code, 575000024)
+    self.assertEqual(arch_trichrome_32_version_code, 575000030)
+    self.assertEqual(arch_trichrome_32_64_version_code, 575000031)
+    self.assertEqual(arch_trichrome_version_code, 575000031)
+    self.assertEqual(arch_trichrome_64_32_version_code, 575000032)
+    self.assertEqual(arch_trichrome_64_32_high_version_code, 575000033)
+    self.assertEqual(arch_trichrome_64_version_code, 575000034)
+    self.assertEqual(arch_trichrome_auto_64_32_version_code, 575000052)
+    self.assertEqual(arch_trichrome_auto_64_32_high_version_code, 575000053)
+    self.assertEqual(arch_trichrome_auto_64_version_code, 575000054)
+    self.assertEqual(arch_trichrome_auto_version_code, 575000051)
+    self.assertEqual(arch_trichrome_auto_32_version_code, 575000050)
+    self.assertEqual(arch_trichrome_auto_32_64_version_code, 575000051)
 
   def testGenerateVersionCodesAndroidArchX64(self):
     """Assert it handles different architectures correctly.
@@ -550,7 +554,7 @@ class _VersionGroupedTest(unittest.TestCase):
                                   is_next_build=False)
     arch_chrome_version_code = output['CHROME_VERSION_CODE']
 
-    self.assertEqual(arch_chrome_version_code, '575000009')
+    self.assertEqual(arch_chrome_version_code, 575000009)
 
   def testGenerateVersionCodesAndroidArchX64Variants(self):
     """Assert it handles 64-bit-specific additional version codes correctly.
@@ -582,21 +586,21 @@ class _VersionGroupedTest(unittest.TestCase):
     arch_trichrome_auto_64_version_code = output[
         'TRICHROME_AUTO_64_VERSION_CODE']
 
-    self.assertEqual(arch_monochrome_32_version_code, '575000026')
-    self.assertEqual(arch_monochrome_32_64_version_code, '575000027')
-    self.assertEqual(arch_monochrome_version_code, '575000027')
-    self.assertEqual(arch_monochrome_64_32_version_code, '575000028')
-    self.assertEqual(arch_monochrome_64_version_code, '575000029')
-    self.assertEqual(arch_trichrome_32_version_code, '575000036')
-    self.assertEqual(arch_trichrome_32_64_version_code, '575000037')
-    self.assertEqual(arch_trichrome_version_code, '575000037')
-    self.assertEqual(arch_trichrome_64_32_version_code, '575000038')
-    self.assertEqual(arch_trichrome_64_version_code, '575000039')
-    self.assertEqual(arch_trichrome_auto_version_code, '575000057')
-    self.assertEqual(arch_trichrome_auto_32_version_code, '575000056')
-    self.assertEqual(arch_trichrome_auto_32_64_version_code, '575000057')
-    self.assertEqual(arch_trichrome_auto_64_version_code, '575000059')
-    self.assertEqual(arch_trichrome_auto_64_32_version_code, '575000058')
+    self.assertEqual(arch_monochrome_32_version_code, 575000026)
+    self.assertEqual(arch_monochrome_32_64_version_code, 575000027)
+    self.assertEqual(arch_monochrome_version_code, 575000027)
+    self.assertEqual(arch_monochrome_64_32_version_code, 575000028)
+    self.assertEqual(arch_monochrome_64_version_code, 575000029)
+    self.assertEqual(arch_trichrome_32_version_code, 575000036)
+    self.assertEqual(arch_trichrome_32_64_version_code, 575000037)
+    self.assertEqual(arch_trichrome_version_code, 575000037)
+    self.assertEqual(arch_trichrome_64_32_version_code, 575000038)
+    self.assertEqual(arch_trichrome_64_version_code, 575000039)
+    self.assertEqual(arch_trichrome_auto_version_code, 575000057)
+    self.assertEqual(arch_trichrome_auto_32_version_code, 575000056)
+    self.assertEqual(arch_trichrome_auto_32_64_version_code, 575000057)
+    self.assertEqual(arch_trichrome_auto_64_version_code, 575000059)
+    self.assertEqual(arch_trichrome_auto_64_32_version_code, 575000058)
 
   def testGenerateVersionCodesAndroidArchRiscv64(self):
     """Assert it handles different architectures correctly.
@@ -611,7 +615,7 @@ class _VersionGroupedTest(unittest.TestCase):
                                   is_next_build=False)
     arch_chrome_version_code = output['CHROME_VERSION_CODE']
 
-    self.assertEqual(arch_chrome_version_code, '575000004')
+    self.assertEqual(arch_chrome_version_code, 575000004)
 
   def testGenerateVersionCodesAndroidArchRiscv64Variants(self):
     """Assert it handles 64-bit-specific additional version codes correctly.
@@ -631,29 +635,29 @@ class _VersionGroupedTest(unittest.TestCase):
     arch_webview_beta_version_code = output['WEBVIEW_BETA_VERSION_CODE']
     arch_webview_dev_version_code = output['WEBVIEW_DEV_VERSION_CODE']
 
-    self.assertEqual(arch_chrome_version_code, '575000004')
-    self.assertEqual(arch_chrome_modern_version_code, '575000014')
-    self.assertEqual(arch_monochrome_version_code, '575000024')
+    self.assertEqual(arch_chrome_version_code, 575000004)
+    self.assertEqual(arch_chrome_modern_version_code, 575000014)
+    self.assertEqual(arch_monochrome_version_code, 575000024)
     self.assertFalse('MONOCHROME_32_VERSION_CODE' in output)
     self.assertFalse('MONOCHROME_32_64_VERSION_CODE' in output)
     self.assertFalse('MONOCHROME_64_32_VERSION_CODE' in output)
     self.assertFalse('MONOCHROME_64_VERSION_CODE' in output)
-    self.assertEqual(arch_trichrome_version_code, '575000034')
+    self.assertEqual(arch_trichrome_version_code, 575000034)
     self.assertFalse('TRICHROME_32_VERSION_CODE' in output)
     self.assertFalse('TRICHROME_32_64_VERSION_CODE' in output)
     self.assertFalse('TRICHROME_64_32_VERSION_CODE' in output)
     self.assertFalse('TRICHROME_64_32_HIGH_VERSION_CODE' in output)
     self.assertFalse('TRICHROME_AUTO_64_32_VERSION_CODE' in output)
     self.assertFalse('TRICHROME_64_VERSION_CODE' in output)
-    self.assertEqual(arch_trichrome_beta_version_code, '575000044')
+    self.assertEqual(arch_trichrome_beta_version_code, 575000044)
     self.assertFalse('TRICHROME_32_BETA_VERSION_CODE' in output)
     self.assertFalse('TRICHROME_32_64_BETA_VERSION_CODE' in output)
     self.assertFalse('TRICHROME_64_32_BETA_VERSION_CODE' in output)
     self.assertFalse('TRICHROME_64_32_HIGH_BETA_VERSION_CODE' in output)
     self.assertFalse('TRICHROME_64_BETA_VERSION_CODE' in output)
-    self.assertEqual(arch_webview_stable_version_code, '575000004')
-    self.assertEqual(arch_webview_beta_version_code, '575000014')
-    self.assertEqual(arch_webview_dev_version_code, '575000024')
+    self.assertEqual(arch_webview_stable_version_code, 575000004)
+    self.assertEqual(arch_webview_beta_version_code, 575000014)
+    self.assertEqual(arch_webview_dev_version_code, 575000024)
     self.assertFalse('WEBVIEW_64_STABLE_VERSION_CODE' in output)
     self.assertFalse('WEBVIEW_64_BETA_VERSION_CODE' in output)
     self.assertFalse('WEBVIEW_64_DEV_VERSION_CODE' in output)
@@ -763,6 +767,65 @@ class _VersionGroupedTest(unittest.TestCase):
     self.assertGreater(trichrome_beta_version_code,
                        trichrome_stable_version_code)
 
+  def testGenerateVersionCodeStrings(self):
+    """Assert the string variant gives the same codes as strings."""
+    output = GenerateVersionCodeStrings(5750, 0,
+                                        arch='arm64',
+                                        is_next_build=False)
+
+    self.assertEqual(output['MONOCHROME_VERSION_CODE'], '575000021')
+    self.assertEqual(output['TRICHROME_64_32_HIGH_VERSION_CODE'], '575000033')
+
+  def testGenerateVersionCodeStringsNextBuild(self):
+    """Assert the string variant handles next builds."""
+    output = GenerateVersionCodeStrings(5750, 0,
+                                        arch='x86',
+                                        is_next_build=True)
+
+    self.assertEqual(output['CHROME_VERSION_CODE'], '575050006')
+
+  def testGenerateVersionCodeStringsMatchesInts(self):
+    """Assert the string variant has the same names as GenerateVersionCodes."""
+    output = GenerateVersionCodes(4844, 0, arch='x64', is_next_build=False)
+    string_output = GenerateVersionCodeStrings(4844, 0,
+                                               arch='x64',
+                                               is_next_build=False)
+
+    self.assertEqual({k: str(v) for k, v in output.items()}, string_output)
+
+  def testGenerateVersionCodesIsReadOnly(self):
+    """Assert the cached result cannot be modified by callers."""
+    output = GenerateVersionCodes(5750, 0, arch='arm', is_next_build=False)
+
+    with self.assertRaises(TypeError):
+      output['CHROME_VERSION_CODE'] = 0
+
+  def testGenerateVersionCodesAcceptsArchEnum(self):
+    """Assert an Arch gives the same codes as its ARCH_CHOICES name."""
+    self.assertEqual(
+        GenerateVersionCodes(5750, 0, arch=Arch.X64, is_next_build=False),
+        GenerateVersionCodes(5750, 0, arch='x64', is_next_build=False))
+
+
+class _VersionCodeTablesTest(unittest.TestCase):
+  """Unittests for the generated android_chrome_version_tables module."""
+
+  def testTablesAreUpToDate(self):
+    """Assert the checked-in tables match the ones they are derived from."""
+    with open(generate_android_chrome_version_tables._OUTPUT_PATH) as f:
+      contents = f.read()
+
+    self.assertEqual(
+        contents,
+        generate_android_chrome_version_tables.GenerateTablesSource(),
+        'Run build/util/generate_android_chrome_version_tables.py')
+
+  def testArchOrderMatchesArchChoices(self):
+    """Assert the generated tables are indexed like Arch."""
+    self.assertEqual(
+        list(generate_android_chrome_version_tables._ARCH_TO_MFG_AND_BITNESS),
+        list(ARCH_CHOICES))
+
 
 class _VersionCodeTest(unittest.TestCase):
   def testGenerateThenTranslate(self):
@@ -986,9 +1049,9 @@ class _VersionCodeTest(unittest.TestCase):
 class _VersionCodeGroupedTest(unittest.TestCase):
   def testGenerateThenTranslate(self):
     """Assert it gives correct values for a version code that we generated."""
-    output = GenerateVersionCodes(5750, 0,
-                                  arch='arm',
-                                  is_next_build=False)
+    output = GenerateVersionCodeStrings(5750, 0,
+                                        arch='arm',
+                                        is_next_build=False)
 
     version_code = output['MONOCHROME_VERSION_CODE']
 
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# Copyright 2026 The Chromium Authors
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+"""Writes android_chrome_version_tables.py.
+
+android_chrome_version.py looks up version codes in the tables of the
+generated module. They are derived from the source tables below and
+precomputed so that importing android_chrome_version does not have to build
+them. Run this script after changing any of the tables below;
+android_chrome_version_test.py fails while the output is stale.
+"""
+
+import os
+import types
+
+_OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'android_chrome_version_tables.py')
+
+_PACKAGE_NAMES = types.MappingProxyType({
+    'CHROME': 0,
+    'CHROME_MODERN': 10,
+    'MONOCHROME': 20,
+    'TRICHROME': 30,
+    'TRICHROME_BETA': 40,
+    'TRICHROME_AUTO': 50,
+    'WEBVIEW_STABLE': 0,
+    'WEBVIEW_BETA': 10,
+    'WEBVIEW_DEV': 20,
+})
+"""List of version numbers to be created for each build configuration.
+Tuple format:
+
+  (version code name), (package name), (supported ABIs)
+
+Here, (supported ABIs) is referring to the combination of browser ABI and
+webview library ABI present in a particular APK. For example, 64_32 implies a
+64-bit browser with an extra 32-bit Webview library. See also
+_ABIS_TO_DIGIT_MASK.
+"""
+_APKS = {
+    '32': (
+        ('CHROME', 'CHROME', '32'),
+        ('CHROME_MODERN', 'CHROME_MODERN', '32'),
+        ('MONOCHROME', 'MONOCHROME', '32'),
+        ('TRICHROME', 'TRICHROME', '32'),
+        ('TRICHROME_AUTO', 'TRICHROME_AUTO', '32'),
+        ('TRICHROME_BETA', 'TRICHROME_BETA', '32'),
+        ('WEBVIEW_STABLE', 'WEBVIEW_STABLE', '32'),
+        ('WEBVIEW_BETA', 'WEBVIEW_BETA', '32'),
+        ('WEBVIEW_DEV', 'WEBVIEW_DEV', '32'),
+    ),
+    '64': (
+        ('CHROME', 'CHROME', '64'),
+        ('CHROME_MODERN', 'CHROME_MODERN', '64'),
+        ('MONOCHROME', 'MONOCHROME', '64'),
+        ('TRICHROME', 'TRICHROME', '64'),
+        ('TRICHROME_AUTO', 'TRICHROME_AUTO', '64'),
+        ('TRICHROME_BETA', 'TRICHROME_BETA', '64'),
+        ('WEBVIEW_STABLE', 'WEBVIEW_STABLE', '64'),
+        ('WEBVIEW_BETA', 'WEBVIEW_BETA', '64'),
+        ('WEBVIEW_DEV', 'WEBVIEW_DEV', '64'),
+    ),
+    'hybrid': (
+        ('CHROME', 'CHROME', '64'),
+        ('CHROME_32', 'CHROME', '32'),
+        ('CHROME_MODERN', 'CHROME_MODERN', '64'),
+        ('MONOCHROME', 'MONOCHROME', '32_64'),
+        ('MONOCHROME_32', 'MONOCHROME', '32'),
+        ('MONOCHROME_32_64', 'MONOCHROME', '32_64'),
+        ('MONOCHROME_64_32', 'MONOCHROME', '64_32'),
+        ('MONOCHROME_64', 'MONOCHROME', '64'),
+        ('TRICHROME', 'TRICHROME', '32_64'),
+        ('TRICHROME_32', 'TRICHROME', '32'),
+        ('TRICHROME_32_64', 'TRICHROME', '32_64'),
+        ('TRICHROME_64_32', 'TRICHROME', '64_32'),
+        ('TRICHROME_64_32_HIGH', 'TRICHROME', '64_32_high'),
+        ('TRICHROME_64', 'TRICHROME', '64'),
+        ('TRICHROME_AUTO', 'TRICHROME_AUTO', '32_64'),
+        ('TRICHROME_AUTO_32', 'TRICHROME_AUTO', '32'),
+        ('TRICHROME_AUTO_32_64', 'TRICHROME_AUTO', '32_64'),
+        ('TRICHROME_AUTO_64', 'TRICHROME_AUTO', '64'),
+        ('TRICHROME_AUTO_64_32', 'TRICHROME_AUTO', '64_32'),
+        ('TRICHROME_AUTO_64_32_HIGH', 'TRICHROME_AUTO', '64_32_high'),
+        ('TRICHROME_BETA', 'TRICHROME_BETA', '32_64'),
+        ('TRICHROME_32_BETA', 'TRICHROME_BETA', '32'),
+        ('TRICHROME_32_64_BETA', 'TRICHROME_BETA', '32_64'),
+        ('TRICHROME_64_32_BETA', 'TRICHROME_BETA', '64_32'),
+        ('TRICHROME_64_32_HIGH_BETA', 'TRICHROME_BETA', '64_32_high'),
+        ('TRICHROME_64_BETA', 'TRICHROME_BETA', '64'),
+        ('WEBVIEW_STABLE', 'WEBVIEW_STABLE', '32_64'),
+        ('WEBVIEW_BETA', 'WEBVIEW_BETA', '32_64'),
+        ('WEBVIEW_DEV', 'WEBVIEW_DEV', '32_64'),
+        ('WEBVIEW_32_STABLE', 'WEBVIEW_STABLE', '32'),
+        ('WEBVIEW_32_BETA', 'WEBVIEW_BETA', '32'),
+        ('WEBVIEW_32_DEV', 'WEBVIEW_DEV', '32'),
+        ('WEBVIEW_64_STABLE', 'WEBVIEW_STABLE', '64'),
+        ('WEBVIEW_64_BETA', 'WEBVIEW_BETA', '64'),
+        ('WEBVIEW_64_DEV', 'WEBVIEW_DEV', '64'),
+    ),
+}
+
+# Splits input build config architecture to manufacturer and bitness. Must be
+# in the order of android_chrome_version.Arch, whose values index the
+# generated tables.
+_ARCH_TO_MFG_AND_BITNESS = {
+    'arm': ('arm', '32'),
+    'arm64': ('arm', 'hybrid'),
+    # Until riscv64 needs a unique version code to ship APKs to the store,
+    # point to the 'arm' bitmask.
+    'riscv64': ('arm', '64'),
+    'x86': ('intel', '32'),
+    'x64': ('intel', 'hybrid'),
+}
+"""
+The architecture preference is encoded into the version_code for devices
+that support multiple architectures. (exploiting play store logic that pushes
+apk with highest version code)
+
+Detail:
+Many Android devices support multiple architectures, and can run applications
+built for any of them; the Play Store considers all of the supported
+architectures compatible and does not, itself, have any preference for which
+is "better". The common cases here:
+
+- All production arm64 devices can also run arm
+- All production x64 devices can also run x86
+- Pretty much all production x86/x64 devices can also run arm (via a binary
+  translator)
+
+Since the Play Store has no particular preferences, you have to encode your own
+preferences into the ordering of the version codes. There's a few relevant
+things here:
+
+- For any android app, it's theoretically preferable to ship a 64-bit version to
+  64-bit devices if it exists, because the 64-bit architectures are supposed to
+  be "better" than their 32-bit predecessors (unfortunately this is not always
+  true due to the effect on memory usage, but we currently deal with this by
+  simply not shipping a 64-bit version *at all* on the configurations where we
+  want the 32-bit version to be used).
+- For any android app, it's definitely preferable to ship an x86 version to x86
+  devices if it exists instead of an arm version, because running things through
+  the binary translator is a performance hit.
+- For WebView, Monochrome, and Trichrome specifically, they are a special class
+  of APK called "multiarch" which means that they actually need to *use* more
+  than one architecture at runtime (rather than simply being compatible with
+  more than one). The 64-bit builds of these multiarch APKs contain both 32-bit
+  and 64-bit code, so that Webview is available for both ABIs. If you're
+  multiarch you *must* have a version that supports both 32-bit and 64-bit
+  version on a 64-bit device, otherwise it won't work properly. So, the 64-bit
+  version needs to be a higher versionCode, as otherwise a 64-bit device would
+  prefer the 32-bit version that does not include any 64-bit code, and fail.
+"""
+
+# Version code suffixes for each manufacturer and bitness, used from build 5750.
+# Some intel devices advertise support for arm, so arm codes must be lower than
+# x86 codes to prevent providing an arm-optimized build to intel devices.
+_ABIS_TO_DIGIT_MASK = {
+    'arm': {
+        '32': 0,
+        '32_64': 1,
+        '64_32': 2,
+        '64_32_high': 3,
+        '64': 4,
+    },
+    'intel': {
+        '32': 6,
+        '32_64': 7,
+        '64_32': 8,
+        '64': 9,
+    },
+}
+
+# Version code suffixes used before build 5750.
+_ABIS_TO_DIGIT_MASK_OLD = {
+    'arm': {
+        '32': 0,
+        '32_64': 3,
+        '64_32': 4,
+        '64': 5,
+        '64_32_high': 9,
+    },
+    'intel': {
+        '32': 1,
+        '32_64': 6,
+        '64_32': 7,
+        '64': 8,
+    },
+}
+
+_HEADER = '''\
+# Copyright 2026 The Chromium Authors
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# Generated by generate_android_chrome_version_tables.py. DO NOT EDIT.
+"""Lookup tables for android_chrome_version.py."""
+'''
+
+
+def _InvertAbisToDigitMask(abis_to_digit_mask):
+  """Maps each version code suffix back to its ABI name (e.g. 'x86_64_32')."""
+  ret = {}
+  for mfg, bitness_to_number in abis_to_digit_mask.items():
+    for bitness, number in bitness_to_number.items():
+      abi = mfg if mfg != 'intel' else 'x86'
+      if bitness != '32':
+        abi += '_' + bitness
+      ret[number] = abi
+  return ret
+
+
+def _ComputeVersionCodeOffsets():
+  """Returns each version code name with the value it adds to the base code.
+
+  Keyed by (Arch value, whether the new ABI scheme is used). Only arm64 builds
+  the 64_32_high variants.
+  """
+  ret = {}
+  for arch_value, (arch, (mfg, bitness)) in enumerate(
+      _ARCH_TO_MFG_AND_BITNESS.items()):
+    for uses_new_abi_scheme in (False, True):
+      if uses_new_abi_scheme:
+        abis_to_digit = _ABIS_TO_DIGIT_MASK[mfg]
+      else:
+        abis_to_digit = _ABIS_TO_DIGIT_MASK_OLD[mfg]
+      ret[(arch_value, uses_new_abi_scheme)] = tuple(
+          (apk + '_VERSION_CODE', _PACKAGE_NAMES[package] + abis_to_digit[abis])
+          for apk, package, abis in _APKS[bitness]
+          if abis != '64_32_high' or arch == 'arm64')
+  return ret
+
+
+def _ComputeTables():
+  """Returns (name, value) pairs for each generated table."""
+  return [
+      ('_ABI_DIGIT_TO_NAME', _InvertAbisToDigitMask(_ABIS_TO_DIGIT_MASK)),
+      ('_ABI_DIGIT_TO_NAME_OLD',
+       _InvertAbisToDigitMask(_ABIS_TO_DIGIT_MASK_OLD)),
+      ('_PACKAGE_DIGIT_TO_NAME', {
+          (number // 10, 'WEBVIEW' in package): package
+          for package, number in _PACKAGE_NAMES.items()
+      }),
+      ('_VERSION_CODE_OFFSETS', _ComputeVersionCodeOffsets()),
+  ]
+
+
+def _FormatTable(table):
+  """Formats a dict whose values are scalars or tuples, one item per line."""
+  lines = ['{']
+  for key, value in table.items():
+    if isinstance(value, tuple):
+      lines.append(f'    {key!r}: (')
+      lines.extend(f'        {item!r},' for item in value)
+      lines.append('    ),')
+    else:
+      lines.append(f'    {key!r}: {value!r},')
+  lines.append('}')
+  return '\n'.join(lines)
+
+
+def GenerateTablesSource():
+  """Returns the expected contents of android_chrome_version_tables.py."""
+  parts = [_HEADER]
+  for name, table in _ComputeTables():
+    parts.append(f'\n{name} = {_FormatTable(table)}\n')
+  return ''.join(parts)
+
+
+def main():
+  with open(_OUTPUT_PATH, 'w') as f:
+    f.write(GenerateTablesSource())
+
+
+if __name__ == '__main__':
+  main()
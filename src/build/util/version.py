@@ -211,8 +211,10 @@ def GenerateValues(options, evals):
     values[key] = str(eval(val, globals(), values))
 
   if options.os == 'android':
-    android_chrome_version_codes = android_chrome_version.GenerateVersionCodes(
-        int(values['BUILD']), int(values['PATCH']), options.arch, options.next)
+    android_chrome_version_codes = (
+        android_chrome_version.GenerateVersionCodeStrings(
+            int(values['BUILD']), int(values['PATCH']), options.arch,
+            options.next))
     values.update(android_chrome_version_codes)
 
   return values